@@ -1,4 +1,4 @@
-__version__ = "0.1.2"
+__version__ = "0.2.0"
 
 from tiger_agent.agent.tiger_agent import TigerAgent
 from tiger_agent.agent.types import AgentResponseContext, ExtraContextDict
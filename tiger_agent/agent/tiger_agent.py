@@ -138,6 +138,7 @@ class TigerAgent:
 
         Returns:
             List of rendered template strings, one for each matching template
+            that rendered to non-blank content
         """
         all_templates = self.jinja_env.list_templates()
         prompt_templates_matching_regex = [
@@ -149,25 +150,24 @@ class TigerAgent:
             key=lambda tmpl: (len(tmpl), tmpl.rsplit(".md", 1)[0].lower())
         )
 
-        extra_context: dict[str, Any] = (
-            {
-                k: v.model_dump() if isinstance(v, BaseModel) else v
-                for k, v in extra_ctx.items()
-            }
-            if self.extra_context is not None and isinstance(self.extra_context, dict)
-            else {}
-        )
+        # build the template variables once and share them across all matching
+        # templates rather than re-dumping the context for each one
+        template_vars: dict[str, Any] = {
+            k: v.model_dump() if isinstance(v, BaseModel) else v
+            for k, v in (extra_ctx or {}).items()
+        }
+        template_vars.update(ctx.model_dump())
 
         rendered_prompts = await asyncio.gather(
             *[
-                self.jinja_env.get_template(tmpl_name).render_async(
-                    **extra_context, **ctx.model_dump()
-                )
+                self.jinja_env.get_template(tmpl_name).render_async(template_vars)
                 for tmpl_name in prompt_templates_matching_regex
             ]
         )
 
-        return rendered_prompts
+        # templates that are entirely conditional render to whitespace when
+        # they do not apply; drop them rather than sending empty prompt parts
+        return [prompt for prompt in rendered_prompts if prompt.strip()]
 
     @logfire.instrument("make_system_prompt", extract_args=False)
     async def make_system_prompt(
@@ -7,6 +7,7 @@ from typing import Any
 
 from pydantic_ai import Agent, BinaryContent, Tool
 from pydantic_ai.messages import UserContent
+from pydantic_ai.models.anthropic import AnthropicModelSettings
 from pydantic_ai.toolsets.abstract import AbstractToolset
 from pydantic_ai_summarization import ContextManagerCapability
 
@@ -35,7 +36,7 @@ from tiger_agent.salesforce.utils import (
     EXT_TO_MIME,
     download_content_version_url,
 )
-from tiger_agent.slack.types import SlackBaseEvent, SlackFile
+from tiger_agent.slack.types import SlackBaseEvent
 from tiger_agent.slack.utils import (
     download_slack_hosted_file,
     fetch_bot_info,
@@ -52,6 +53,60 @@ from tiger_agent.utils import (
     wrap_mcp_servers_with_exception_handling,
 )
 
+# The system prompt and tool definitions only vary with the bot and the kind
+# of event being handled, so mark them as cache breakpoints. Every model
+# request of a run (and later runs for the same kind of event) then re-reads
+# them from Anthropic's prompt cache instead of paying full input-token cost
+# and prefill latency. Other providers ignore these settings.
+AGENT_MODEL_SETTINGS = AnthropicModelSettings(
+    anthropic_cache_instructions=True,
+    anthropic_cache_tool_definitions=True,
+)
+
+# Invariants of every agent run, built once at import rather than per task.
+_EVENT_TYPE_BY_NAME: dict[str, type] = {
+    cls.__name__: cls for cls in EVENT_TYPE_REGISTRY
+}
+_EVENT_TYPE_OPTIONS = "\n".join(
+    f"- {cls.__name__}: {cls.event_description}" for cls in EVENT_TYPE_REGISTRY
+)
+_USER_GROUP_ID_RE = re.compile(r"^S[0-9A-Z]{10}$")
+_CHANNEL_ID_RE = re.compile(r"C[0-9A-Z]{10}")
+_ORG_CALENDAR_TOOL = Tool(
+    get_calender_events,
+    takes_ctx=False,
+    name="get_org_calendar_events",
+    description=(
+        "Fetch events from the organization's shared calendar (Justworks feed) "
+        "between two datetimes. Returns a list of CalenderEvent objects with "
+        "`summary`, `start`, `end`, and `type` fields.\n\n"
+        "The `type` field is one of:\n"
+        "- 'payday' — company paydays / payroll dates\n"
+        "- 'pto' — an employee is out of office (vacation, sick, personal, etc.)\n\n"
+        "Use the optional `events_to_filter` argument to restrict results to "
+        "one or more of those types. Examples:\n"
+        "- 'when is the next payday?' → events_to_filter=['payday']\n"
+        "- 'who is out next week?' or 'who is on PTO on Friday?' → events_to_filter=['pto']\n"
+        "- 'what's on the company calendar this week?' → omit events_to_filter to get everything.\n\n"
+        "Pass timezone-aware `start` and `end` datetimes bounding the window you "
+        "want to search. Note: PTO events are typically all-day, so widen the "
+        "window if you're checking a specific day.\n\n"
+        "The calendar is cached between calls. Only set `force_refresh=True` "
+        "if the user explicitly asks to refresh, reload, or bypass the cache "
+        "(e.g. 'refresh the calendar', 'pull the latest calendar data', "
+        "'the calendar looks stale, re-check'). Leave it False (the default) "
+        "for every other request — even if the user is asking about 'today' "
+        "or 'right now'."
+    ),
+)
+# needs nothing from the task, so it is built once like the calendar tool
+_DOWNLOAD_SLACK_HOSTED_FILE_TOOL = Tool(
+    download_slack_hosted_file,
+    takes_ctx=False,
+    name="download_slack_hosted_file",
+    description="This will download a file associated with a Slack message and return its contents. Note: only images, text, or PDFs are supported.",
+)
+
 
 def _build_toolset(mcp_config: McpConfig) -> AbstractToolset:
     """Wrap an McpConfig's toolset with tool-name filtering and prefixing."""
@@ -113,18 +168,14 @@ async def create_agent_and_context(
             thread_ts=event.thread_ts,
         )
 
-        extra_ctx["thread_history"] = pretty_print_models(thread_messages)
+        if thread_messages:
+            extra_ctx["thread_history"] = pretty_print_models(thread_messages)
 
     system_prompt = await agent.make_system_prompt(ctx=ctx, extra_ctx=extra_ctx)
     user_prompt = await agent.make_user_prompt(ctx=ctx, extra_ctx=extra_ctx)
 
     toolsets = [_build_toolset(mcp_config) for mcp_config in mcp_servers.values()]
 
-    async def _download_slack_hosted_file(
-        file: SlackFile,
-    ) -> BinaryContent | str | None:
-        return await download_slack_hosted_file(file=file)
-
     def _download_salesforce_hosted_file(
         url: str, filename: str
     ) -> BinaryContent | str:
@@ -136,10 +187,6 @@ async def create_agent_and_context(
         except Exception as e:
             return f"Failed to download file: {e}"
 
-    _event_type_by_name: dict[str, type] = {
-        cls.__name__: cls for cls in EVENT_TYPE_REGISTRY
-    }
-
     async def _list_user_defined_rules() -> list[UserDefinedRule]:
         assert isinstance(event, SlackBaseEvent)
         return await list_user_defined_rules(pool=hctx.pool, owner_slack_id=event.user)
@@ -158,12 +205,12 @@ async def create_agent_and_context(
         criteria_examples: list[str] | None = None,
     ) -> UserDefinedRule:
         assert isinstance(event, SlackBaseEvent)
-        if event_type not in _event_type_by_name:
+        if event_type not in _EVENT_TYPE_BY_NAME:
             raise ValueError(
                 f"Unknown event_type {event_type!r}. "
-                f"Valid options: {', '.join(_event_type_by_name)}"
+                f"Valid options: {', '.join(_EVENT_TYPE_BY_NAME)}"
             )
-        cls = _event_type_by_name[event_type]
+        cls = _EVENT_TYPE_BY_NAME[event_type]
         subtype_field = cls.model_fields.get("subtype")
         event_subtype = (
             subtype_field.default
@@ -182,7 +229,7 @@ async def create_agent_and_context(
         )
 
     async def _get_user_ids_in_user_group(group_name_or_id: str) -> list[str] | str:
-        is_group_id = re.match(r"^S[0-9A-Z]{10}$", group_name_or_id)
+        is_group_id = _USER_GROUP_ID_RE.match(group_name_or_id)
 
         group_id: str | None = group_name_or_id if is_group_id else None
 
@@ -201,7 +248,7 @@ async def create_agent_and_context(
         )
 
     async def _get_user_ids_in_channel(channel_id: str) -> list[str] | str:
-        if not re.fullmatch(r"C[0-9A-Z]{10}", channel_id):
+        if not _CHANNEL_ID_RE.fullmatch(channel_id):
             return (
                 f"Invalid channel id [{channel_id}]. Expected format: "
                 "'C' followed by 10 uppercase alphanumeric characters (e.g. 'C0123456789')."
@@ -218,17 +265,8 @@ async def create_agent_and_context(
             event=event, lookback_hours=lookback_hours
         )
 
-    event_type_options = "\n".join(
-        f"- {cls.__name__}: {cls.event_description}" for cls in EVENT_TYPE_REGISTRY
-    )
-
     tools = [
-        Tool(
-            _download_slack_hosted_file,
-            takes_ctx=False,
-            name="download_slack_hosted_file",
-            description="This will download a file associated with a Slack message and return its contents. Note: only images, text, or PDFs are supported.",
-        ),
+        _DOWNLOAD_SLACK_HOSTED_FILE_TOOL,
         Tool(
             _download_salesforce_hosted_file,
             takes_ctx=False,
@@ -239,33 +277,7 @@ async def create_agent_and_context(
                 "Pass the src as url and the alt attribute value as filename."
             ),
         ),
-        Tool(
-            get_calender_events,
-            takes_ctx=False,
-            name="get_org_calendar_events",
-            description=(
-                "Fetch events from the organization's shared calendar (Justworks feed) "
-                "between two datetimes. Returns a list of CalenderEvent objects with "
-                "`summary`, `start`, `end`, and `type` fields.\n\n"
-                "The `type` field is one of:\n"
-                "- 'payday' — company paydays / payroll dates\n"
-                "- 'pto' — an employee is out of office (vacation, sick, personal, etc.)\n\n"
-                "Use the optional `events_to_filter` argument to restrict results to "
-                "one or more of those types. Examples:\n"
-                "- 'when is the next payday?' → events_to_filter=['payday']\n"
-                "- 'who is out next week?' or 'who is on PTO on Friday?' → events_to_filter=['pto']\n"
-                "- 'what's on the company calendar this week?' → omit events_to_filter to get everything.\n\n"
-                "Pass timezone-aware `start` and `end` datetimes bounding the window you "
-                "want to search. Note: PTO events are typically all-day, so widen the "
-                "window if you're checking a specific day.\n\n"
-                "The calendar is cached between calls. Only set `force_refresh=True` "
-                "if the user explicitly asks to refresh, reload, or bypass the cache "
-                "(e.g. 'refresh the calendar', 'pull the latest calendar data', "
-                "'the calendar looks stale, re-check'). Leave it False (the default) "
-                "for every other request — even if the user is asking about 'today' "
-                "or 'right now'."
-            ),
-        ),
+        _ORG_CALENDAR_TOOL,
         *(
             [
                 Tool(
@@ -296,7 +308,7 @@ async def create_agent_and_context(
                         "Call this when the user wants to be notified, alerted, or asks to create a rule or automation. "
                         "Creates a persistent rule that triggers a custom action when a matching event occurs. "
                         "Infer all parameters from the user's request.\n"
-                        f"event_type must be one of:\n{event_type_options}\n"
+                        f"event_type must be one of:\n{_EVENT_TYPE_OPTIONS}\n"
                         "criteria_examples are optional but improve matching accuracy."
                     ),
                 ),
@@ -368,6 +380,7 @@ async def create_agent_and_context(
     pydantic_agent = Agent(
         capabilities=[ContextManagerCapability(max_tokens=950_000)],
         model=agent.model,
+        model_settings=AGENT_MODEL_SETTINGS,
         deps_type=dict[str, Any],
         system_prompt=system_prompt,
         output_type=AgentSalesforceResponse
@@ -2,7 +2,10 @@ import asyncio
 from datetime import timedelta
 from pathlib import Path
 
+from aiohttp import ClientSession, TCPConnector
+
 from tiger_agent.agent.tiger_agent import TigerAgent
+from tiger_agent.db.utils import fit_pool_to_server
 from tiger_agent.listeners.harness import ListenerHarness
 from tiger_agent.salesforce.types import (
     SalesforceAssignmentChangedEvent,
@@ -19,6 +22,7 @@ from tiger_agent.slack.types import (
     SlackMessageEvent,
     SlackSalesforceCaseThreadMessageEvent,
 )
+from tiger_agent.slack.utils import fetch_bot_info
 from tiger_agent.tasks.handlers import (
     AgentFeedbackRatingHandler,
     AgentFeedbackRequestReminderHandler,
@@ -57,7 +61,7 @@ class TigerApp:
 
     Bring your own context (for full control):
 
-        hctx = HarnessContext(app=..., pool=..., trigger=..., num_workers=10)
+        hctx = HarnessContext(app=..., pool=..., num_workers=10)
         agent = MyCoolAgent(...)
         app = TigerApp(agent=agent, hctx=hctx)
         asyncio.run(app.run())
@@ -75,6 +79,7 @@ class TigerApp:
         rate_limit_interval: timedelta = timedelta(minutes=1),
         # HarnessContext args — only used when hctx is not provided
         num_workers: int = 5,
+        max_concurrent_tasks: int | None = None,
         proactive_prompt_channels: list[str] | None = None,
         worker_sleep_seconds: int = 60,
         worker_min_jitter_seconds: int = -15,
@@ -86,6 +91,7 @@ class TigerApp:
         if hctx is None:
             hctx = get_harness_ctx(
                 num_workers=num_workers,
+                max_concurrent_tasks=max_concurrent_tasks,
                 proactive_prompt_channels=proactive_prompt_channels,
                 worker_sleep_seconds=worker_sleep_seconds,
                 worker_min_jitter_seconds=worker_min_jitter_seconds,
@@ -145,7 +151,37 @@ class TigerApp:
         self._task_harness = TaskHarness(processor, hctx=hctx)
 
     async def run(self) -> None:
-        await self._hctx.pool.open(wait=True)
-        async with asyncio.TaskGroup() as tasks:
-            await self._task_harness.run(tasks)
-            await self._listener_harness.start(tasks)
+        # Without a session the Slack SDK opens (and tears down) a new HTTP
+        # session for every API call. Share one for the lifetime of the app so
+        # calls reuse keep-alive connections instead of a fresh TLS handshake.
+        # The client may be shared with other apps in this process; only the
+        # app that installs the session removes it again once it is closed.
+        client = self._hctx.app.client
+        async with ClientSession(
+            connector=TCPConnector(keepalive_timeout=75)
+        ) as slack_session:
+            owns_session = client.session is None
+            if owns_session:
+                client.session = slack_session
+            try:
+                async with asyncio.TaskGroup() as tasks:
+                    # Fetch the bot's profile while the pool connects instead
+                    # of after migrations. It is in place before any worker
+                    # starts on a backlog, and the listeners reuse it.
+                    bot_info = (
+                        tasks.create_task(fetch_bot_info(client))
+                        if self._hctx.bot_info is None
+                        else None
+                    )
+                    await self._hctx.pool.open(wait=True)
+                    # resizing works on a live pool, so it does not need to
+                    # hold up migrations or the workers; it never raises, so
+                    # it cannot cancel the workers and listeners in this group
+                    tasks.create_task(fit_pool_to_server(self._hctx.pool))
+                    if bot_info is not None:
+                        self._hctx.bot_info = await bot_info
+                    await self._task_harness.run(tasks)
+                    await self._listener_harness.start(tasks)
+            finally:
+                if owns_session:
+                    client.session = None
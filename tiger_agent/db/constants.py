@@ -1,3 +1,20 @@
 import os
 
-PG_MAX_POOL_SIZE: int = int(os.getenv("PG_MAX_POOL_SIZE", "10"))
+# the pool's maximum size is derived from the server's max_connections at
+# startup: every replica gets an equal share of this fraction of them.
+# PG_MAX_POOL_SIZE, if set, pins the maximum instead
+PG_POOL_CONNECTION_RATIO: float = float(os.getenv("PG_POOL_CONNECTION_RATIO", "0.5"))
+PG_POOL_REPLICAS: int = int(os.getenv("PG_POOL_REPLICAS", "1"))
+PG_MAX_POOL_SIZE: int | None = (
+    int(os.environ["PG_MAX_POOL_SIZE"]) if os.getenv("PG_MAX_POOL_SIZE") else None
+)
+
+# how long a caller waits for a pooled connection before PoolTimeout is raised;
+# a starved pool fails fast instead of queuing callers behind each other
+PG_POOL_TIMEOUT_SECONDS: float = float(os.getenv("PG_POOL_TIMEOUT_SECONDS", "5"))
+# most callers allowed to queue for a connection before new ones are rejected
+# with TooManyRequests right away; 0 lets the queue grow without bound
+PG_POOL_MAX_WAITING: int = int(os.getenv("PG_POOL_MAX_WAITING", "0"))
+
+# channel agent.insert_event() notifies when a visible event is inserted
+EVENT_NOTIFY_CHANNEL = "agent_event"
@@ -1,15 +1,23 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Literal
 
 import logfire
-from psycopg import AsyncConnection
-from psycopg.rows import dict_row
-from psycopg.types.json import Jsonb
+import orjson
+from psycopg import AsyncConnection, AsyncCursor, OperationalError
+from psycopg.rows import class_row, dict_row
+from psycopg.types.json import Jsonb, set_json_dumps, set_json_loads
 from psycopg_pool import AsyncConnectionPool
-from pydantic import ValidationError
-
-from tiger_agent.db.constants import PG_MAX_POOL_SIZE
+from pydantic import TypeAdapter, ValidationError
+
+from tiger_agent.db.constants import (
+    PG_MAX_POOL_SIZE,
+    PG_POOL_CONNECTION_RATIO,
+    PG_POOL_MAX_WAITING,
+    PG_POOL_REPLICAS,
+    PG_POOL_TIMEOUT_SECONDS,
+)
 from tiger_agent.salesforce.types import (
     SalesforceBaseEvent,
     SalesforceFeedItem,
@@ -24,30 +32,103 @@ from tiger_agent.tasks.types import Task as Event
 
 logger = logging.getLogger(__name__)
 
+# validates a whole claimed batch in one call instead of one call per row
+_EVENTS_ADAPTER = TypeAdapter(list[Event])
+
+
+def _dumps_json(obj: Any) -> bytes:
+    # like json.dumps, accept dicts with non-string keys
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
 
 async def _configure_database_connection(con: AsyncConnection) -> None:
-    """Configure new database connections with autocommit enabled."""
-    await con.set_autocommit(True)
+    """Configure new database connections.
+
+    json/jsonb values (every inserted and claimed event payload) are encoded
+    and decoded with orjson. Autocommit is already on: the pool passes it
+    when connecting.
+    """
+    set_json_dumps(_dumps_json, con)
+    set_json_loads(orjson.loads, con)
 
 
-async def _reset_database_connection(con: AsyncConnection) -> None:
-    """Reset database connections to autocommit mode when returned to pool."""
-    await con.set_autocommit(True)
+async def _check_database_connection(con: AsyncConnection) -> None:
+    """Reject pooled connections already known to be unusable.
+
+    Unlike AsyncConnectionPool.check_connection this costs no round-trip on
+    every checkout. A connection the server dropped while idle fails on first
+    use instead and is discarded by the pool; the harness also verifies idle
+    connections periodically.
+    """
+    if con.closed or con.broken:
+        raise OperationalError("pooled connection is no longer usable")
 
 
 def create_default_pool(num_workers: int) -> AsyncConnectionPool:
     """Create a default PostgreSQL connection pool with standard configuration.
 
+    Keeps a connection open for every worker plus two for the listeners
+    inserting events, so workers never wait on the pool to grow. The pool
+    may grow beyond that up to PG_MAX_POOL_SIZE, or up to the size picked
+    by fit_pool_to_server once the pool is open. Callers that cannot get a
+    connection within PG_POOL_TIMEOUT_SECONDS fail with PoolTimeout, and once
+    PG_POOL_MAX_WAITING callers are queued further ones fail immediately.
+    The LISTEN connection is opened outside the pool and not counted here.
+
     Returns:
         AsyncConnectionPool: Configured pool with autocommit and connection lifecycle handlers.
     """
+    min_size = num_workers + 2
+    max_size = PG_MAX_POOL_SIZE or min_size
+    if max_size < min_size:
+        logger.warning(
+            "PG_MAX_POOL_SIZE is too small for the workers, using the minimum size",
+            extra={"pg_max_pool_size": max_size, "min_size": min_size},
+        )
     return AsyncConnectionPool(
-        check=AsyncConnectionPool.check_connection,
+        check=_check_database_connection,
         configure=_configure_database_connection,
-        min_size=num_workers + 1,
-        max_size=PG_MAX_POOL_SIZE,
+        kwargs={"autocommit": True},
+        min_size=min_size,
+        max_size=max(min_size, max_size),
+        timeout=PG_POOL_TIMEOUT_SECONDS,
+        max_waiting=PG_POOL_MAX_WAITING,
         open=False,
-        reset=_reset_database_connection,
+    )
+
+
+async def fit_pool_to_server(pool: AsyncConnectionPool) -> None:
+    """Derive the pool's maximum size from the server's max_connections.
+
+    Every replica gets an equal share (PG_POOL_REPLICAS) of
+    PG_POOL_CONNECTION_RATIO of the server's connections, but never fewer
+    than the pool keeps open. A too-small pool stalls workers waiting for a
+    connection; a too-large one lets replicas exhaust the server together.
+    Does nothing if PG_MAX_POOL_SIZE is set.
+
+    This is only tuning: if it fails, the error is logged and the pool keeps
+    its default size rather than failing the caller.
+    """
+    if PG_MAX_POOL_SIZE is not None:
+        return
+    try:
+        async with pool.connection() as con, con.cursor() as cur:
+            await cur.execute("show max_connections")
+            row = await cur.fetchone()
+        max_connections = int(row[0])
+        max_size = max(
+            pool.min_size,
+            int(max_connections * PG_POOL_CONNECTION_RATIO) // max(PG_POOL_REPLICAS, 1),
+        )
+        await pool.resize(min_size=pool.min_size, max_size=max_size)
+    except Exception:
+        logfire.exception("failed to size database pool, keeping default size")
+        return
+    logfire.info(
+        "database pool sized",
+        max_connections=max_connections,
+        min_size=pool.min_size,
+        max_size=max_size,
     )
 
 
@@ -72,6 +153,7 @@ async def usage_limit_reached(
                 WHERE event->>'user' = %s AND event_ts >= now() - %s
             ) combined""",
             (user_id, interval, user_id, interval),
+            prepare=True,
         )
         row = await result.fetchone()
         total_requests = int(row[0]) if row and row[0] is not None else 0
@@ -81,7 +163,9 @@ async def usage_limit_reached(
 async def user_ignored(pool: AsyncConnectionPool, user_id: str) -> bool:
     """Check if a user is currently ignored."""
     async with pool.connection() as con:
-        result = await con.execute("SELECT agent.is_user_ignored(%s)", (user_id,))
+        result = await con.execute(
+            "SELECT agent.is_user_ignored(%s)", (user_id,), prepare=True
+        )
         row = await result.fetchone()
         return bool(row[0]) if row and row[0] is not None else False
 
@@ -114,16 +198,76 @@ async def insert_event(
     """
     async with (
         pool.connection() as con,
-        con.transaction() as _,
         con.cursor() as cur,
     ):
         await cur.execute(
             "select agent.insert_event(%s, %s::timestamptz)",
             [Jsonb(event), vt],
+            prepare=True,
+        )
+
+
+class EventInsertBatcher:
+    """Coalesces concurrent insert_event calls into multi-row inserts.
+
+    Callers await insert(); run() collects whatever arrives within a short
+    debounce window (up to max_batch events) and stores the batch with a
+    single multi-row insert through agent.insert_events(). Either the whole
+    batch is stored or every caller in it gets the exception, so callers may
+    retry.
+
+    Args:
+        pool: Database connection pool
+        max_batch: Most events stored per round-trip
+        debounce_seconds: How long to wait for more events after the first
+    """
+
+    def __init__(
+        self,
+        pool: AsyncConnectionPool,
+        max_batch: int = 64,
+        debounce_seconds: float = 0.005,
+    ):
+        self._pool = pool
+        self._max_batch = max_batch
+        self._debounce_seconds = debounce_seconds
+        self._queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future[None]]] = (
+            asyncio.Queue()
         )
 
+    async def insert(self, event: dict[str, Any]) -> None:
+        """Store an event, returning once its batch is committed."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((event, future))
+        await future
+
+    async def run(self) -> None:
+        """Drain queued inserts forever; run this as a task."""
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(self._debounce_seconds)
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                async with (
+                    self._pool.connection() as con,
+                    con.cursor() as cur,
+                ):
+                    await cur.execute(
+                        "select agent.insert_events(%s::jsonb[])",
+                        ([Jsonb(event) for event, _ in batch],),
+                        prepare=True,
+                    )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+
 
-@logfire.instrument("insert_handled_event", extract_args=False)
 async def insert_handled_event(pool: AsyncConnectionPool, event: dict[str, Any]) -> int:
     """Insert a Slack event directly into the event history table as processed.
 
@@ -138,58 +282,110 @@ async def insert_handled_event(pool: AsyncConnectionPool, event: dict[str, Any])
     """
     async with (
         pool.connection() as con,
-        con.transaction() as _,
         con.cursor() as cur,
     ):
-        await cur.execute("select agent.insert_event_hist(%s)", (Jsonb(event),))
+        await cur.execute(
+            "select agent.insert_event_hist(%s)", (Jsonb(event),), prepare=True
+        )
         result = await cur.fetchone()
         return result[0] if result else None
 
 
-async def claim_event(
-    pool: AsyncConnectionPool, max_attempts: int = 3, invisibility_minutes: int = 10
-) -> Event | None:
-    """Atomically claim an event for processing.
+async def _claim_events(
+    cur: AsyncCursor[dict[str, Any]],
+    max_attempts: int,
+    invisibility_minutes: int,
+    limit: int,
+) -> list[Event]:
+    """Claim up to `limit` events on an existing cursor.
+
+    Malformed events are moved to history and skipped so they are not retried.
+    """
+    await cur.execute(
+        "select * from agent.claim_events(%s, %s, %s)",
+        (max_attempts, timedelta(minutes=invisibility_minutes), limit),
+        prepare=True,
+    )
+    rows: list[dict[str, Any]] = await cur.fetchall()
+    try:
+        return _EVENTS_ADAPTER.validate_python(rows)
+    except ValidationError:
+        pass
+    # at least one row is malformed; find it the slow way
+    events: list[Event] = []
+    for row in rows:
+        try:
+            events.append(Event.model_validate(row))
+        except ValidationError as e:
+            logger.exception(
+                "failed to parse claimed event",
+                exc_info=e,
+                extra={"id": row.get("id")},
+            )
+            # if we got a malformed event, delete it to avoid retry loops
+            await cur.execute(
+                "select agent.delete_event(%s::int8, _processed=>false)",
+                (row["id"],),
+            )
+    return events
+
 
-    Uses agent.claim_event() to find and lock an available event,
-    updating its visibility threshold to prevent other workers from
-    claiming it simultaneously.
+async def claim_events(
+    pool: AsyncConnectionPool,
+    max_attempts: int = 3,
+    invisibility_minutes: int = 10,
+    limit: int = 5,
+) -> list[Event]:
+    """Atomically claim up to `limit` events for processing in one round-trip.
+
+    Uses agent.claim_events() to find and lock available events under a single
+    FOR UPDATE SKIP LOCKED scan. Malformed events are moved to history and
+    skipped so they are not retried.
 
     Returns:
-        Event: Claimed event ready for processing, or None if no events available
+        list[Event]: Claimed events ready for processing, possibly empty
     """
     with logfire.suppress_instrumentation():
         async with (
             pool.connection() as con,
-            con.transaction() as _,
             con.cursor(row_factory=dict_row) as cur,
+        ):
+            return await _claim_events(cur, max_attempts, invisibility_minutes, limit)
+
+
+async def complete_and_claim_events(
+    pool: AsyncConnectionPool,
+    event: Event,
+    max_attempts: int = 3,
+    invisibility_minutes: int = 10,
+    limit: int = 1,
+) -> list[Event]:
+    """Mark an event as processed and claim up to `limit` more in one round-trip.
+
+    Pipelines agent.delete_event() and agent.claim_events() on a single
+    connection, so a worker working through a backlog does not pay a
+    separate round-trip and pool checkout to complete each event. Both run
+    in one implicit transaction: if the completion fails, nothing is claimed
+    and the error is raised.
+
+    Args:
+        event: The event that was successfully processed
+
+    Returns:
+        list[Event]: Newly claimed events ready for processing, possibly empty
+    """
+    with logfire.suppress_instrumentation():
+        async with (
+            pool.connection() as con,
+            con.cursor(row_factory=dict_row) as cur,
+            con.pipeline(),
         ):
             await cur.execute(
-                "select * from agent.claim_event(%s, %s::int8 * interval '1m')",
-                (max_attempts, invisibility_minutes),
+                "select agent.delete_event(%s)", (event.id,), prepare=True
             )
-            row: dict[str, Any] | None = await cur.fetchone()
-            if not row:
-                return None
-            try:
-                assert row["id"] is not None, "claimed an empty event"
-                return Event(**row)
-            except ValidationError as e:
-                logger.exception(
-                    "failed to parse claimed event",
-                    exc_info=e,
-                    extra={"id": row.get("id")},
-                )
-                if row["id"] is not None:
-                    # if we got a malformed event, delete it to avoid retry loops
-                    await cur.execute(
-                        "select agent.delete_event(%s::int8, _processed=>false)",
-                        (row["id"],),
-                    )
-                return None
+            return await _claim_events(cur, max_attempts, invisibility_minutes, limit)
 
 
-@logfire.instrument("delete_event", extract_args=False)
 async def delete_event(pool: AsyncConnectionPool, event: Event) -> None:
     """Mark an event as successfully processed.
 
@@ -199,15 +395,16 @@ async def delete_event(pool: AsyncConnectionPool, event: Event) -> None:
     Args:
         event: The event that was successfully processed
     """
-    async with (
-        pool.connection() as con,
-        con.transaction() as _,
-        con.cursor() as cur,
-    ):
-        await cur.execute("select agent.delete_event(%s)", (event.id,))
+    with logfire.suppress_instrumentation():
+        async with (
+            pool.connection() as con,
+            con.cursor() as cur,
+        ):
+            await cur.execute(
+                "select agent.delete_event(%s)", (event.id,), prepare=True
+            )
 
 
-@logfire.instrument("get_event_hist", extract_args=False)
 async def get_event_hist(pool: AsyncConnectionPool, event_id: int) -> Event | None:
     """Get an event from the event_hist table by ID.
 
@@ -222,15 +419,16 @@ async def get_event_hist(pool: AsyncConnectionPool, event_id: int) -> Event | No
     """
     async with (
         pool.connection() as con,
-        con.transaction() as _,
         con.cursor(row_factory=dict_row) as cur,
     ):
-        await cur.execute("select * from agent.event_hist where id = %s", (event_id,))
+        await cur.execute(
+            "select * from agent.event_hist where id = %s", (event_id,), prepare=True
+        )
         row: dict[str, Any] | None = await cur.fetchone()
         if not row:
             return None
         try:
-            return Event(**row)
+            return Event.model_validate(row)
         except ValidationError as e:
             logger.exception(
                 "failed to parse historical event",
@@ -260,6 +458,7 @@ async def get_salesforce_case_thread_case_id(
             result = await con.execute(
                 "SELECT case_id FROM agent.salesforce_case_thread WHERE channel_id = %s AND thread_ts = %s",
                 (channel_id, thread_ts),
+                prepare=True,
             )
             row = await result.fetchone()
             return row[0] if row else None
@@ -289,12 +488,12 @@ async def delete_expired_events(
     with logfire.suppress_instrumentation():
         async with (
             pool.connection() as con,
-            con.transaction() as _,
             con.cursor() as cur,
         ):
             await cur.execute(
-                "select agent.delete_expired_events(%s, %s::int8 * interval '1m')",
-                (max_attempts, max_age_minutes),
+                "select agent.delete_expired_events(%s, %s)",
+                (max_attempts, timedelta(minutes=max_age_minutes)),
+                prepare=True,
             )
 
 
@@ -332,7 +531,7 @@ async def is_case_assignment_new(
 
         if current_row:
             try:
-                event = Event(**current_row)
+                event = Event.model_validate(current_row)
 
                 # there is an unprocessed new_assignee event
                 # that has the same owner
@@ -360,7 +559,7 @@ async def is_case_assignment_new(
         processed_row: dict[str, Any] | None = await result.fetchone()
         if processed_row:
             try:
-                event = Event(**processed_row)
+                event = Event.model_validate(processed_row)
 
                 # there is an processed new_assignee event
                 # that has the same owner
@@ -386,6 +585,7 @@ async def get_salesforce_account_id_for_channel(
         result = await con.execute(
             "SELECT salesforce_account_id FROM agent.customer_channel_salesforce_link WHERE channel_id = %s",
             (channel_id,),
+            prepare=True,
         )
         row = await result.fetchone()
         return row[0] if row else None
@@ -413,6 +613,27 @@ async def remove_salesforce_account_id_for_channel(
         )
 
 
+def _already_handled_feed_item_query(table_name: str) -> str:
+    return f"""
+        SELECT elem->>'id' AS id
+        FROM jsonb_array_elements(%s::jsonb) AS elem
+        WHERE EXISTS (
+            SELECT 1 FROM agent.{table_name}
+            WHERE event_ts = (elem->>'created_date')::timestamptz
+              AND event->>'type' = 'salesforce_event'
+              AND event->>'subtype' = 'new_feed_item'
+              AND event->'feed_item'->>'Id' = elem->>'id'
+        )
+    """
+
+
+# a feed item is already handled if it is queued or in history
+_ALREADY_HANDLED_FEED_ITEM_QUERIES: tuple[str, ...] = tuple(
+    _already_handled_feed_item_query(table_name)
+    for table_name in ("event", "event_hist")
+)
+
+
 async def filter_new_feed_items(
     pool: AsyncConnectionPool, feed_items: list[SalesforceFeedItem]
 ) -> list[SalesforceFeedItem]:
@@ -420,34 +641,15 @@ async def filter_new_feed_items(
     if not feed_items:
         return []
 
-    if not feed_items:
-        return []
-
     items_json = Jsonb(
         [{"id": item.Id, "created_date": item.CreatedDate} for item in feed_items]
     )
 
-    def get_already_handled_query(table_name: str) -> str:
-        return f"""
-            SELECT elem->>'id' AS id
-            FROM jsonb_array_elements(%s::jsonb) AS elem
-            WHERE EXISTS (
-                SELECT 1 FROM agent.{table_name}
-                WHERE event_ts = (elem->>'created_date')::timestamptz
-                  AND event->>'type' = 'salesforce_event'
-                  AND event->>'subtype' = 'new_feed_item'
-                  AND event->'feed_item'->>'Id' = elem->>'id'
-            )
-        """
-
     async with pool.connection() as con:
-        result = await con.execute(get_already_handled_query("event"), [items_json])
-        existing_ids = {row[0] for row in await result.fetchall()}
-
-        result = await con.execute(
-            get_already_handled_query("event_hist"), [items_json]
-        )
-        existing_ids |= {row[0] for row in await result.fetchall()}
+        existing_ids: set[str] = set()
+        for query in _ALREADY_HANDLED_FEED_ITEM_QUERIES:
+            result = await con.execute(query, [items_json])
+            existing_ids.update(row[0] for row in await result.fetchall())
 
     return [item for item in feed_items if item.Id not in existing_ids]
 
@@ -456,7 +658,10 @@ async def get_matching_user_defined_rules(
     pool: AsyncConnectionPool, event_type: str, event_subtype: str | None = None
 ) -> list[UserDefinedRule]:
     """Return enabled custom rules that match the given event type and optional subtype."""
-    async with pool.connection() as con, con.cursor(row_factory=dict_row) as cur:
+    async with (
+        pool.connection() as con,
+        con.cursor(row_factory=class_row(UserDefinedRule)) as cur,
+    ):
         if event_subtype is not None:
             await cur.execute(
                 """SELECT *
@@ -465,6 +670,7 @@ async def get_matching_user_defined_rules(
                      AND (event_subtype IS NULL OR event_subtype = %s)
                      AND enabled = true""",
                 (event_type, event_subtype),
+                prepare=True,
             )
         else:
             await cur.execute(
@@ -472,8 +678,9 @@ async def get_matching_user_defined_rules(
                    FROM agent.user_defined_rules
                    WHERE event_type = %s AND enabled = true""",
                 (event_type,),
+                prepare=True,
             )
-        return [UserDefinedRule(**row) for row in await cur.fetchall()]
+        return await cur.fetchall()
 
 
 async def get_feedback_request_reminder(
@@ -493,7 +700,7 @@ async def get_feedback_request_reminder(
         row = await cur.fetchone()
 
         if row:
-            return Event(**row)
+            return Event.model_validate(row)
         return None
 
 
@@ -560,7 +767,10 @@ async def insert_user_defined_rule(
         event_type=event_type,
         event_subtype=event_subtype,
     )
-    async with pool.connection() as con, con.cursor(row_factory=dict_row) as cur:
+    async with (
+        pool.connection() as con,
+        con.cursor(row_factory=class_row(UserDefinedRule)) as cur,
+    ):
         await cur.execute(
             """INSERT INTO agent.user_defined_rules
                    (name, owner_slack_id, event_type, event_subtype, criteria, criteria_examples, action_prompt)
@@ -576,7 +786,7 @@ async def insert_user_defined_rule(
                 action_prompt,
             ),
         )
-        rule = UserDefinedRule(**await cur.fetchone())
+        rule = await cur.fetchone()
         logfire.info("Custom rule inserted", rule_id=rule.id, name=rule.name)
         return rule
 
@@ -585,7 +795,10 @@ async def list_user_defined_rules(
     pool: AsyncConnectionPool, owner_slack_id: str
 ) -> list[UserDefinedRule]:
     """Return all rules owned by the given Slack user."""
-    async with pool.connection() as con, con.cursor(row_factory=dict_row) as cur:
+    async with (
+        pool.connection() as con,
+        con.cursor(row_factory=class_row(UserDefinedRule)) as cur,
+    ):
         await cur.execute(
             """SELECT *
                FROM agent.user_defined_rules
@@ -593,7 +806,7 @@ async def list_user_defined_rules(
                ORDER BY created_at DESC""",
             (owner_slack_id,),
         )
-        return [UserDefinedRule(**row) for row in await cur.fetchall()]
+        return await cur.fetchall()
 
 
 async def delete_user_defined_rule(
@@ -9,6 +9,7 @@ import logfire
 import schedule
 
 from tiger_agent.db.utils import (
+    EventInsertBatcher,
     get_salesforce_case_thread_thread_id,
     insert_event,
     is_case_assignment_new,
@@ -35,23 +36,30 @@ from tiger_agent.salesforce.utils import (
     subscribe_to_topic,
 )
 from tiger_agent.types import HarnessContext
+from tiger_agent.utils import backoff_sleep
 
 CASE_OWNER_CHANGED_TOPIC = "CaseOwnerChangedTopic"
 CASE_STATUS_CHANGED_TOPIC = "CaseStatusChangedTopic"
 CASE_CREATED_TOPIC = "CaseCreatedTopic"
 
+# a failed scheduled job is retried within 1s, the window doubling up to this cap while it keeps failing
+SCHEDULE_RETRY_MAX_BACKOFF_SECONDS = 60
+
 
 class SalesforceListener(Listener):
     def __init__(self, hctx: HarnessContext):
         assert hctx.salesforce_client is not None, "salesforce_client is required"
         self._salesforce_client = hctx.salesforce_client
         self._pool = hctx.pool
-        self._trigger = hctx.trigger
         self._new_case_poller: SalesforceNewCasePoller | None
         self._feed_item_poller: SalesforceCaseFeedItemPoller | None
+        # a feed item poll can find many new items at once; handling them
+        # concurrently lets their inserts share multi-row round-trips
+        self._event_inserts = EventInsertBatcher(hctx.pool)
 
     @logfire.instrument("SalesforceEventHandler start")
     async def start(self, tasks: TaskGroup):
+        tasks.create_task(self._event_inserts.run())
 
         self._new_case_poller = SalesforceNewCasePoller(
             pool=self._pool,
@@ -128,8 +136,24 @@ class SalesforceListener(Listener):
             logfire.info("PushTopic created", extra={"id": result["id"]})
 
     async def _run_schedule(self):
+        backoff_seconds = 1
         while True:
-            schedule.run_pending()
+            # a failing job must not take down the TaskGroup (and with it the
+            # workers and the Slack listener). schedule does not reschedule a
+            # job that raised, so it is due again on the next pass; back off
+            # instead of retrying it every second while it keeps failing
+            try:
+                schedule.run_pending()
+            except Exception:
+                logfire.exception(
+                    "Error running scheduled job", backoff_seconds=backoff_seconds
+                )
+                await backoff_sleep(backoff_seconds)
+                backoff_seconds = min(
+                    backoff_seconds * 2, SCHEDULE_RETRY_MAX_BACKOFF_SECONDS
+                )
+                continue
+            backoff_seconds = 1
             await asyncio.sleep(1)
 
     @logfire.instrument("handle_updated_case_assignee", extract_args=["case"])
@@ -167,8 +191,6 @@ class SalesforceListener(Listener):
             event=SalesforceAssignmentChangedEvent(case=full_case_data).model_dump(),
         )
 
-        await self._trigger.put(True)
-
     @logfire.instrument("handle_case_created", extract_args=["case"])
     async def handle_case_created(self, case: CaseData):
         if not SALESFORCE_CASE_CHANNEL:
@@ -189,8 +211,6 @@ class SalesforceListener(Listener):
             event=SalesforceCaseCreatedEvent(case=full_case_data).model_dump(),
         )
 
-        await self._trigger.put(True)
-
     async def _subscribe_to_event(
         self,
         topic_name: str,
@@ -232,7 +252,6 @@ class SalesforceListener(Listener):
                 slack_channel_id=channel_id,
             ).model_dump(),
         )
-        await self._trigger.put(True)
 
     @logfire.instrument("handle_new_feed_item", extract_args=False)
     async def handle_new_feed_item(self, feed_item: SalesforceFeedItem):
@@ -254,10 +273,8 @@ class SalesforceListener(Listener):
                 }
             )
 
-        await insert_event(
-            pool=self._pool,
-            event=SalesforceFeedItemEvent(
-                feed_item=feed_item, event_ts=event_ts
-            ).model_dump(mode="json"),
+        await self._event_inserts.insert(
+            SalesforceFeedItemEvent(feed_item=feed_item, event_ts=event_ts).model_dump(
+                mode="json"
+            )
         )
-        await self._trigger.put(True)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import re
 from asyncio import TaskGroup
@@ -9,6 +10,7 @@ from slack_bolt.context.ack.async_ack import AsyncAck
 from slack_bolt.context.respond.async_respond import AsyncRespond
 
 from tiger_agent.db.utils import (
+    EventInsertBatcher,
     get_event_hist,
     get_salesforce_account_id_for_channel,
     get_salesforce_case_thread_case_id,
@@ -43,12 +45,10 @@ from tiger_agent.slack.types import (
     FeedbackReminderThread,
     SlackCommand,
     SlackSalesforceCaseThreadMessageEvent,
-    UserInfo,
 )
 from tiger_agent.slack.utils import (
     fetch_bot_info,
     fetch_end_of_day_for_user,
-    fetch_team_info,
     fetch_user_info,
     handle_new_salesforce_case_workflow_form_cancel,
     handle_new_salesforce_case_workflow_form_submit,
@@ -63,12 +63,29 @@ from tiger_agent.tasks.handlers import TaskProcessor
 from tiger_agent.tasks.utils import process_task
 from tiger_agent.types import HarnessContext
 
+# Message subtypes that carry something a user wrote. The rest (edits,
+# deletions, channel joins, topic changes, ...) are notifications the agent
+# never acts on, so they are dropped before doing any lookups for them.
+_USER_MESSAGE_SUBTYPES = frozenset(
+    {None, "file_share", "thread_broadcast", "me_message"}
+)
+
+# Slack is acked before a mention is stored, so a failed insert is retried
+# with exponential backoff (0.5s, 1s, ...) before the mention is given up on.
+_INSERT_EVENT_ATTEMPTS = 4
+_INSERT_EVENT_BACKOFF_SECONDS = 0.5
+
+# every slash command routed to this app goes to the admin command handler.
+# Bolt only takes a string or a pattern; this one is decided by the first
+# character instead of consuming the whole command name
+_ANY_COMMAND = re.compile(r"^/")
+
 
 class SlackListener(Listener):
     """Listens for Slack events and enqueues tasks for processing.
 
     Args:
-        ctx: Shared context providing app, pool, trigger, and optional salesforce client
+        ctx: Shared context providing app, pool, and optional salesforce client
         task_processor: Callback to process tasks triggered by interactive actions
         slack_app_token: Slack app-level token for Socket Mode
         proactive_prompt_channels: Optional set of channel IDs for proactive prompting
@@ -82,18 +99,25 @@ class SlackListener(Listener):
         self._hctx = hctx
         self._pool = hctx.pool
         self._app = hctx.app
-        self._trigger = hctx.trigger
         self._task_processor = task_processor
         self._proactive_prompt_channels = (
-            set(hctx.proactive_prompt_channels)
+            frozenset(hctx.proactive_prompt_channels)
             if hctx.proactive_prompt_channels
             else None
         )
         self._bot_info: BotInfo | None = None
+        self._bot_mention: str | None = None
+        self._event_inserts = EventInsertBatcher(hctx.pool)
 
     async def start(self, tasks: TaskGroup):
-        self._bot_info = await fetch_bot_info(self._app.client)
-        self._hctx.bot_info = self._bot_info
+        tasks.create_task(self._event_inserts.run())
+        # TigerApp fetches the profile during startup; only fetch it here
+        # when the listener is started on its own
+        if self._hctx.bot_info is None:
+            self._hctx.bot_info = await fetch_bot_info(self._app.client)
+        self._bot_info = self._hctx.bot_info
+        # checked against every proactive-prompt channel message
+        self._bot_mention = f"<@{self._bot_info.user_id}>"
         self._app.action(CONFIRM_PROACTIVE_PROMPT)(self._handle_proactive_prompt)
         self._app.action(REJECT_PROACTIVE_PROMPT)(self._handle_proactive_prompt)
 
@@ -109,22 +133,40 @@ class SlackListener(Listener):
         self._app.action(FEEDBACK_FORM_TRIGGER)(self._handle_feedback_form_trigger)
         self._app.view(FEEDBACK_FORM_SUBMIT)(self._handle_feedback_form_submit)
         self._app.event("message")(self._on_message)
-        self._app.command(re.compile(r"\/.*"))(self._on_slack_admin_command)
+        self._app.command(_ANY_COMMAND)(self._on_slack_admin_command)
         self._app.event("app_mention")(self._on_slack_event)
 
         handler = AsyncSocketModeHandler(self._app, app_token=SLACK_APP_TOKEN)
         tasks.create_task(handler.start_async())
 
     async def _on_slack_event(self, ack: AsyncAck, event: dict[str, Any]):
-        await set_status(
-            self._app.client,
-            channel_id=event.get("channel"),
-            thread_ts=event.get("thread_ts") or event.get("ts"),
-            is_busy=True,
-        )
-        await insert_event(self._pool, event)
+        # ack within Slack's 3s window before doing any I/O of our own
         await ack()
-        await self._trigger.put(True)
+        async with TaskGroup() as tg:
+            tg.create_task(
+                set_status(
+                    self._app.client,
+                    channel_id=event.get("channel"),
+                    thread_ts=event.get("thread_ts") or event.get("ts"),
+                    is_busy=True,
+                )
+            )
+            tg.create_task(self._insert_event_with_retry(event))
+
+    async def _insert_event_with_retry(self, event: dict[str, Any]) -> None:
+        for attempt in range(_INSERT_EVENT_ATTEMPTS):
+            try:
+                await self._event_inserts.insert(event)
+                return
+            except Exception:
+                if attempt == _INSERT_EVENT_ATTEMPTS - 1:
+                    logfire.exception(
+                        "Failed to enqueue Slack event, dropping it",
+                        channel=event.get("channel"),
+                        ts=event.get("ts"),
+                    )
+                    return
+                await asyncio.sleep(_INSERT_EVENT_BACKOFF_SECONDS * 2**attempt)
 
     async def _on_slack_admin_command(
         self, ack: AsyncAck, respond: AsyncRespond, command: dict[str, Any]
@@ -136,43 +178,25 @@ class SlackListener(Listener):
         )
         await respond(text=response, response_type="ephemeral", delete_original=True)
 
-    async def get_reply_prefix_for_sender(self, user_info: UserInfo) -> tuple[str, str]:
-        """Returns (text_prefix, html_prefix) for use in Salesforce email comments."""
-        in_same_team_as_bot = self._bot_info.team_id == user_info.team_id
-        profile_workspace_url: str | None = None
-        if in_same_team_as_bot:
-            profile_workspace_url = self._bot_info.url.strip("/")
-        else:
-            team_info = await fetch_team_info(
-                self._app.client, team_id=user_info.team_id
-            )
-            if team_info:
-                profile_workspace_url = f"https://{team_info.domain}.slack.com"
-
-        text_prefix = f"[Replied via Slack as @{user_info.name}]"
-        if profile_workspace_url:
-            user_profile_url = f"{profile_workspace_url}/team/{user_info.id}"
-            html_prefix = f'[Replied via Slack as <a href="{user_profile_url}">@{user_info.name}</a>]'
-        else:
-            html_prefix = text_prefix
-
-        return text_prefix, html_prefix
-
     async def _on_message(self, ack: AsyncAck, event: dict[str, Any]):
         await ack()
 
+        if event.get("subtype") not in _USER_MESSAGE_SUBTYPES:
+            return
+
         # agent should ignore its own messages
         user = event.get("user")
         if user == self._bot_info.user_id or user is None:
             return
 
-        event["subtype"] = event["channel_type"]
+        # handlers (and stored history) read the channel type as the subtype
+        event["subtype"] = channel_type = event["channel_type"]
         channel = event.get("channel")
         thread_ts = event.get("thread_ts")
         files = event.get("files", [])
 
         # if the message was in an im to the agent, respond (even though agent was not mentioned)
-        if event["subtype"] in ("im"):
+        if channel_type == "im":
             await self._on_slack_event(ack, event)
             return
 
@@ -207,17 +231,16 @@ class SlackListener(Listener):
                     salesforce_case_id=salesforce_case_id_for_slack_thread,
                 ).model_dump(),
             )
-            await self._trigger.put(True)
 
         # if proactive prompting is enabled for channel and agent is not mentioned
         # then offer a proactive prompt
+        # (cheapest checks first: thread replies never get one, so most
+        # messages skip the mention search)
         elif (
-            self._proactive_prompt_channels
+            not thread_ts
+            and self._proactive_prompt_channels
             and channel in self._proactive_prompt_channels
-            and not re.search(
-                rf"<@{re.escape(self._bot_info.user_id)}>", event.get("text", "")
-            )
-            and not thread_ts
+            and self._bot_mention not in event.get("text", "")
         ):
             user = event.get("user")
 
@@ -273,7 +296,6 @@ class SlackListener(Listener):
                 service_id=service_id,
             ).model_dump(),
         )
-        await self._trigger.put(True)
 
     async def _handle_new_salesforce_case_workflow_form_cancel(
         self, ack: AsyncAck, respond: AsyncRespond
@@ -356,7 +378,6 @@ class SlackListener(Listener):
             ).model_dump(),
         )
 
-        await self._hctx.trigger.put(True)
         logfire.info(
             "Feedback form submitted",
             rating=rating,
@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Callable
 from datetime import timedelta
 from pathlib import Path
 
@@ -11,6 +12,15 @@ from tiger_agent.migrations import runner
 from tiger_agent.utils import setup_logging
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Run on uvloop when it is installed, the default asyncio loop otherwise."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 @click.group()
 def cli():
     pass
@@ -38,18 +48,24 @@ def cli():
 @click.option(
     "--worker-sleep-seconds",
     type=int,
+    envvar="WORKER_SLEEP_SECONDS",
+    show_envvar=True,
     default=60,
     help="Worker sleep duration in seconds",
 )
 @click.option(
     "--worker-min-jitter-seconds",
     type=int,
+    envvar="WORKER_MIN_JITTER_SECONDS",
+    show_envvar=True,
     default=-15,
     help="Minimum jitter for worker sleep",
 )
 @click.option(
     "--worker-max-jitter-seconds",
     type=int,
+    envvar="WORKER_MAX_JITTER_SECONDS",
+    show_envvar=True,
     default=15,
     help="Maximum jitter for worker sleep",
 )
@@ -72,6 +88,12 @@ def cli():
     help="Task invisibility timeout in minutes",
 )
 @click.option("--num-workers", type=int, default=5, help="Number of worker processes")
+@click.option(
+    "--max-concurrent-tasks",
+    type=int,
+    default=None,
+    help="Maximum tasks claimed or processed at once across all workers (defaults to twice --num-workers)",
+)
 @click.option(
     "--rate-limit-allowed-requests",
     type=int,
@@ -105,6 +127,7 @@ def run(
     max_age_minutes: int = 60,
     invisibility_minutes: int = 10,
     num_workers: int = 5,
+    max_concurrent_tasks: int | None = None,
     rate_limit_allowed_requests: int | None = None,
     rate_limit_interval: int = 1,
     proactive_prompt_channels: list[str] = None,
@@ -121,6 +144,7 @@ def run(
         rate_limit_allowed_requests=rate_limit_allowed_requests,
         rate_limit_interval=timedelta(minutes=rate_limit_interval),
         num_workers=num_workers,
+        max_concurrent_tasks=max_concurrent_tasks,
         proactive_prompt_channels=proactive_prompt_channels,
         worker_sleep_seconds=worker_sleep_seconds,
         worker_min_jitter_seconds=worker_min_jitter_seconds,
@@ -130,7 +154,7 @@ def run(
         invisibility_minutes=invisibility_minutes,
     )
 
-    asyncio.run(app.run())
+    asyncio.run(app.run(), loop_factory=_loop_factory())
 
 
 @cli.command()
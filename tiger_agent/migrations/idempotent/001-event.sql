@@ -1,18 +1,85 @@
 --001-event.sql
 
+-----------------------------------------------------------------------
+-- agent.slack_message_handled
+create or replace function agent.slack_message_handled(_event jsonb) returns boolean
+as $func$
+    -- the unique index on agent.event only dedupes messages still queued;
+    -- this catches Slack redelivering one that was already moved to
+    -- agent.event_hist. event_ts is the hypertable's partition column, so
+    -- the lookup only reads the chunk holding the original
+    select _event->>'type' in ('app_mention', 'message')
+    and exists
+    (
+        select 1
+        from agent.event_hist h
+        where h.event_ts = agent.to_timestamptz((_event->>'event_ts')::numeric)
+        and h.event->>'type' = _event->>'type'
+        and h.event->>'channel' = _event->>'channel'
+        and h.event->>'ts' = _event->>'ts'
+    )
+$func$ language sql stable security invoker
+;
+
 -----------------------------------------------------------------------
 -- agent.insert_event
 create or replace function agent.insert_event(_event jsonb, vt timestamptz = NULL) returns void
 as $func$
-    insert into agent.event
-    ( event_ts
-    , event
-    , vt
+    with i as
+    (
+        insert into agent.event
+        ( event_ts
+        , event
+        , vt
+        )
+        select
+          coalesce(agent.to_timestamptz((_event->>'event_ts')::numeric), now())
+        , _event
+        , coalesce(vt, now())
+        where not agent.slack_message_handled(_event)
+        -- Slack may deliver the same message again; queue it only once
+        on conflict ((event->>'type'), (event->>'channel'), (event->>'ts'))
+        where event->>'type' in ('app_mention', 'message')
+        do nothing
+        returning id, vt
     )
-    select
-      coalesce(agent.to_timestamptz((_event->>'event_ts')::numeric), now())
-    , _event
-    , coalesce(vt, now())
+    -- wake listening workers (in any process) if the event is visible now.
+    -- notifications are delivered on commit. the payload is the event id so
+    -- that several inserts in one transaction are not collapsed into one
+    select pg_notify('agent_event', i.id::text)
+    from i
+    where i.vt <= now()
+    ;
+$func$ language sql volatile security invoker
+;
+
+-----------------------------------------------------------------------
+-- agent.insert_events
+create or replace function agent.insert_events(_events jsonb[]) returns void
+as $func$
+    -- same as agent.insert_event() for a batch of events visible now, as a
+    -- single multi-row insert
+    with i as
+    (
+        insert into agent.event
+        ( event_ts
+        , event
+        , vt
+        )
+        select
+          coalesce(agent.to_timestamptz((e->>'event_ts')::numeric), now())
+        , e
+        , now()
+        from unnest(_events) e
+        where not agent.slack_message_handled(e)
+        -- Slack may deliver the same message again; queue it only once
+        on conflict ((event->>'type'), (event->>'channel'), (event->>'ts'))
+        where event->>'type' in ('app_mention', 'message')
+        do nothing
+        returning id
+    )
+    select pg_notify('agent_event', i.id::text)
+    from i
     ;
 $func$ language sql volatile security invoker
 ;
@@ -24,13 +91,15 @@ create or replace function agent.claim_event
 , _invisible_for interval default interval '10m'
 ) returns setof agent.event
 as $func$
+    -- see docs/database.md: a claim lost in a crash only makes the event visible again
+    select set_config('synchronous_commit', 'off', true);
     with x as
     (
         select e.id
         from agent.event e
         where e.vt <= now() -- must be visible
         and e.attempts < _max_attempts -- must not have exceeded attempts
-        order by random() -- shuffle the deck
+        order by e.vt -- oldest first; walks the (vt, attempts) index and stops at the limit
         limit 1
         for update
         skip locked
@@ -51,10 +120,65 @@ $func$ language sql volatile security invoker
 ;
 
 
+-----------------------------------------------------------------------
+-- agent.claim_events
+create or replace function agent.claim_events
+( _max_attempts int4 default 3
+, _invisible_for interval default interval '10m'
+, _limit int4 default 5
+) returns table
+( id int8
+, event_ts timestamptz
+, attempts int4
+, vt timestamptz
+, last_claimed timestamptz
+, event jsonb
+)
+as $func$
+    -- see docs/database.md: a claim lost in a crash only makes the event visible again
+    select set_config('synchronous_commit', 'off', true);
+    with x as
+    (
+        select e.id
+        from agent.event e
+        where e.vt <= now() -- must be visible
+        and e.attempts < _max_attempts -- must not have exceeded attempts
+        order by e.vt -- oldest first; walks the (vt, attempts) index and stops at the limit
+        limit _limit
+        for update
+        skip locked
+    )
+    , u as
+    (
+        update agent.event u set
+          vt = clock_timestamp() + _invisible_for -- invisible for a bit while we work it
+        , attempts = u.attempts + 1
+        , claimed = claimed || now()
+        from x
+        where u.id = x.id
+        returning u.*
+    )
+    -- only the latest claim is returned; the full claimed history stays in
+    -- the table (and moves to agent.event_hist) for auditing
+    select
+      u.id
+    , u.event_ts
+    , u.attempts
+    , u.vt
+    , u.claimed[cardinality(u.claimed)]
+    , u.event
+    from u
+$func$ language sql volatile security invoker
+;
+
+
+
 -----------------------------------------------------------------------
 -- agent.delete_event
 create or replace function agent.delete_event(_id int8, _processed boolean default true) returns void
 as $func$
+    -- see docs/database.md: a completion lost in a crash only makes the event visible again
+    select set_config('synchronous_commit', 'off', true);
     with d as
     (
         delete from agent.event
@@ -91,12 +215,22 @@ create or replace function agent.delete_expired_events
 , _max_vt_age interval default interval '1h'
 ) returns void
 as $func$
-    with d as
+    -- only one session sweeps at a time; the others skip instead of racing to
+    -- delete the same rows. the lock is released when the transaction ends
+    with l as
+    (
+        select pg_try_advisory_xact_lock(hashtext('agent.delete_expired_events')) as locked
+    )
+    , d as
     (
         delete from agent.event e
-        where e.attempts >= _max_attempts
+        using l
+        where l.locked
+        and
+        ( e.attempts >= _max_attempts
         or e.vt <= (now() - _max_vt_age)
-        returning *
+        )
+        returning e.*
     )
     insert into agent.event_hist
     ( id
@@ -0,0 +1,24 @@
+--007-event-slack-message-unique.sql
+
+-----------------------------------------------------------------------
+-- a Slack message is queued at most once, so a redelivered mention is
+-- dropped by agent.insert_event() instead of being answered twice.
+-- this index covers messages still queued; agent.slack_message_handled()
+-- covers the ones already moved to agent.event_hist.
+-- keep the oldest copy of anything already queued more than once
+delete from agent.event e
+using agent.event o
+where e.event->>'type' in ('app_mention', 'message')
+and o.event->>'type' = e.event->>'type'
+and o.event->>'channel' = e.event->>'channel'
+and o.event->>'ts' = e.event->>'ts'
+and o.id < e.id
+;
+
+create unique index event_slack_message_uq on agent.event
+( (event->>'type')
+, (event->>'channel')
+, (event->>'ts')
+)
+where event->>'type' in ('app_mention', 'message')
+;
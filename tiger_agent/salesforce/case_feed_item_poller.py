@@ -88,7 +88,8 @@ class SalesforceCaseFeedItemPoller:
             return
 
         logfire.info("New case feed items found", count=len(filtered_new_feed_items))
-        for feed_item in filtered_new_feed_items:
+
+        async def handle(feed_item: SalesforceFeedItem) -> None:
             try:
                 await self._handler(feed_item)
             except Exception:
@@ -96,6 +97,9 @@ class SalesforceCaseFeedItemPoller:
                     "Error handling new feed item", feed_item_id=feed_item.Id
                 )
 
+        # handled concurrently so the handler's inserts can be batched
+        await asyncio.gather(*(handle(item) for item in filtered_new_feed_items))
+
     def start(self, run_immediate: bool = False) -> None:
         def job():
             asyncio.create_task(self._poll())
@@ -1,6 +1,7 @@
 import asyncio
 import re
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 
@@ -60,10 +61,10 @@ admin/
 
 ## Pattern Matching
 
-Commands use `re.match()` to match patterns from the beginning of tokens:
+Keys are matched against whole tokens:
 - String keys like "admin" create exact matches
 - Regex keys like `r"<@[A-Z0-9]+\|[^>]+>"` match Slack user mentions
-- First matching pattern wins (order matters in command lists)
+- Exact matches are checked first, then regex keys in order (first match wins)
 
 ## Error Handling
 
@@ -71,6 +72,24 @@ If no command matches, the system returns available subcommands for that level.
 Commands can validate argument counts and return appropriate error messages.
 """
 
+_WHITESPACE_RE = re.compile(r"\s+")
+# keeps content between < > together, e.g. "<@U123|user name>"
+_TOKEN_RE = re.compile(r"<[^>]+>|\S+")
+_REGEX_KEY_CHARS = frozenset("<[(\\")
+
+
+def _is_regex(key: str) -> bool:
+    """Whether a command key is meant as a regex pattern rather than a literal."""
+    return not _REGEX_KEY_CHARS.isdisjoint(key)
+
+
+def _tokenize(command_text: str) -> deque[str]:
+    """Remove redundant spaces, then split by spaces.
+
+    Example: "admin   ignore @user" becomes deque(['admin', 'ignore', '@user'])
+    """
+    return deque(_TOKEN_RE.findall(_WHITESPACE_RE.sub(" ", command_text).strip()))
+
 
 @dataclass
 class CommandContext:
@@ -86,45 +105,65 @@ class CommandBase(ABC):
     # this is used to match the command, can be a regex pattern or just a string
     key: str | None = None
     name: str | None = None
+    _compiled_key: re.Pattern[str] | None = field(default=None, init=False, repr=False)
 
-    @abstractmethod
-    async def __call__(self, command_text: str | list[str], ctx: CommandContext) -> str:
-        pass
-
-    def _get_args(self, command_text: str | list[str]) -> list[str] | None:
-        """Remove redundant spaces, then split by spaces.
+    def __post_init__(self):
+        if self.key and _is_regex(self.key):
+            # anchored so a pattern has to match the whole token
+            self._compiled_key = re.compile(rf"(?:{self.key})\Z")
 
-        Example: "admin   ignore @user" becomes ['admin', 'ignore', '@user']
-        """
-        if isinstance(command_text, str):
-            # First normalize whitespace
-            normalized = re.sub(r"\s+", " ", command_text).strip()
-            # Split on spaces but keep content between < > together
-            return re.findall(r"<[^>]+>|\S+", normalized)
-        return command_text
+    @abstractmethod
+    async def __call__(self, args: deque[str], ctx: CommandContext) -> str:
+        """Handle the remaining tokens of a command; consumes them from args."""
 
 
 @dataclass
 class Command(CommandBase):
     expected_parameters: int = 0
-    func: Callable[[CommandContext, str | list[str]], Awaitable[str]] = lambda _: (
+    func: Callable[[CommandContext, list[str]], Awaitable[str]] = lambda _: (
         asyncio.sleep(0)
     )
 
-    async def __call__(self, command_text: str | list[str], ctx: CommandContext) -> str:
-        args = self._get_args(command_text=command_text)
+    async def __call__(self, args: deque[str], ctx: CommandContext) -> str:
         if len(args) != self.expected_parameters:
             return f"Incorrect number of parameters given for <{self.key}>"
-        return await self.func(ctx, args)
+        return await self.func(ctx, list(args))
 
 
 @dataclass
 class CommandGroup(CommandBase):
     commands: list[CommandBase] = field(default_factory=list)
-    _commands_dict: dict[str, CommandBase] = field(default_factory=dict, init=False)
+    _literal: dict[str, CommandBase] = field(default_factory=dict, init=False)
+    _regex: list[CommandBase] = field(default_factory=list, init=False)
+    _help_text: str = field(default="", init=False)
 
-    def __post_init__(self):
-        self._commands_dict = {x.key: x for x in self.commands}
+    def freeze(self) -> "CommandGroup":
+        """Precompute lookup tables and help text for this group and its subgroups.
+
+        The command tree does not change once it is built, so this is called once
+        after construction and leaves dispatch with nothing but lookups.
+        """
+        for x in self.commands:
+            if isinstance(x, CommandGroup):
+                x.freeze()
+
+        # literal keys resolve with a dict lookup, regex keys (compiled when the
+        # command is created) are only scanned in declaration order when no
+        # literal key matches
+        self._literal = {
+            x.key: x for x in self.commands if x.key and x._compiled_key is None
+        }
+        self._regex = [x for x in self.commands if x._compiled_key is not None]
+        self._help_text = self._get_commands()
+        return self
+
+    def _match_command(self, curr: str) -> CommandBase | None:
+        matching_command = self._literal.get(curr)
+        if matching_command is None:
+            for command in self._regex:
+                if command._compiled_key.match(curr):
+                    return command
+        return matching_command
 
     def _get_commands(self):
         lines = []
@@ -139,17 +178,14 @@ class CommandGroup(CommandBase):
 
         return "\n".join(lines)
 
-    async def __call__(self, command_text: str | list[str], ctx: CommandContext) -> str:
-        args = self._get_args(command_text=command_text)
-
-        has_more_args = len(args) > 0
-        curr = args.pop(0) if has_more_args else None
+    async def __call__(self, args: deque[str], ctx: CommandContext) -> str:
+        curr = args.popleft() if args else None
         matching_command = None
         if curr is not None:
-            matching_command = self._commands_dict.get(curr)
+            matching_command = self._match_command(curr)
 
         if matching_command is None:
-            result = f"{f'<{curr}> is an invalid command.\n' if curr is not None else ''}Available commands:\n{self._get_commands()}"
+            result = f"{f'<{curr}> is an invalid command.\n' if curr is not None else ''}Available commands:\n{self._help_text}"
             return result
 
         return await matching_command(args, ctx)
@@ -161,7 +197,6 @@ async def handle_admins_add_command(ctx: CommandContext, args: list[str]) -> str
         return "Argument needs to be a Slack username"
     async with (
         ctx.hctx.pool.connection() as con,
-        con.transaction() as _,
         con.cursor() as cur,
     ):
         await cur.execute(
@@ -176,7 +211,6 @@ async def handle_admins_remove_command(ctx: CommandContext, args: list[str]) ->
         return "Argument needs to be a Slack username"
     async with (
         ctx.hctx.pool.connection() as con,
-        con.transaction() as _,
         con.cursor() as cur,
     ):
         await cur.execute(
@@ -191,7 +225,6 @@ async def handle_ignored_add_command(ctx: CommandContext, args: list[str]) -> st
         return "Argument needs to be a Slack username"
     async with (
         ctx.hctx.pool.connection() as con,
-        con.transaction() as _,
         con.cursor() as cur,
     ):
         await cur.execute(
@@ -206,7 +239,6 @@ async def handle_ignored_remove_command(ctx: CommandContext, args: list[str]) ->
         return "Argument needs to be a Slack username"
     async with (
         ctx.hctx.pool.connection() as con,
-        con.transaction() as _,
         con.cursor() as cur,
     ):
         await cur.execute(
@@ -319,8 +351,6 @@ async def handle_salesforce_create_notification_command(
         ).model_dump(),
     )
 
-    await ctx.hctx.trigger.put(True)
-
     return f"The Slack message will be sent to channel <#{SALESFORCE_CASE_CHANNEL}>"
 
 
@@ -424,7 +454,7 @@ def _build_command_handlers() -> CommandGroup:
                     ],
                 ),
             ]
-        )
+        ).freeze()
     return _slash_commands
 
 
@@ -433,4 +463,4 @@ async def handle_command(command: SlackCommand, hctx: HarnessContext, bot_info:
         return "Slash commands can only be used by admins."
     ctx = CommandContext(hctx=hctx, command=command, bot_info=bot_info)
     handlers = _build_command_handlers()
-    return await handlers(command.text, ctx)
+    return await handlers(_tokenize(command.text), ctx)
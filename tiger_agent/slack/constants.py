@@ -7,6 +7,8 @@ AGENT_FEEDBACK_RECEIVED_SLACK_CHANNEL = os.environ.get(
     "AGENT_FEEDBACK_RECEIVED_SLACK_CHANNEL", None
 )
 
+USER_INFO_TTL_SECONDS = int(os.environ.get("USER_INFO_TTL_SECONDS", 300))
+
 CONFIRM_PROACTIVE_PROMPT = "confirm_proactive_prompt"
 REJECT_PROACTIVE_PROMPT = "reject_proactive_prompt"
 
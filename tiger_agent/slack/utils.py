@@ -15,6 +15,7 @@ structured data models for Slack entities.
 import asyncio
 import json
 import re
+import time
 from collections.abc import Sequence
 from datetime import datetime, timedelta
 from typing import Any
@@ -52,6 +53,7 @@ from tiger_agent.slack.constants import (
     NEW_SALESFORCE_CASE_WORKFLOW_FORM_TRIGGER,
     REJECT_PROACTIVE_PROMPT,
     SLACK_BOT_TOKEN,
+    USER_INFO_TTL_SECONDS,
 )
 from tiger_agent.slack.types import (
     BotInfo,
@@ -66,6 +68,12 @@ from tiger_agent.slack.types import (
 from tiger_agent.types import HarnessContext
 from tiger_agent.utils import file_type_supported
 
+# user_id -> (monotonic fetch time, user info), oldest fetch first
+_user_info_cache: dict[str, tuple[float, UserInfo]] = {}
+# user_id -> lock for a lookup in progress
+_user_info_locks: dict[str, asyncio.Lock] = {}
+_background_tasks: set[asyncio.Task] = set()
+
 
 def parse_slack_user_name(mention_string: str) -> tuple[str, str] | None:
     """Parse Slack user mention format <@USER_ID|username> and return (username, user_id).
@@ -208,7 +216,6 @@ async def remove_reaction(client: AsyncWebClient, channel: str, ts: str, emoji:
         pass
 
 
-@logfire.instrument("fetch_user_info", extract_args=["user_id"])
 async def fetch_user_info(client: AsyncWebClient, user_id: str) -> UserInfo | None:
     """Fetch comprehensive user information from Slack API.
 
@@ -216,6 +223,9 @@ async def fetch_user_info(client: AsyncWebClient, user_id: str) -> UserInfo | No
     for creating context-aware responses. Returns None on any API error to allow
     graceful degradation when user info is unavailable.
 
+    Successful lookups are cached for USER_INFO_TTL_SECONDS, and concurrent
+    lookups for the same user share a single API call.
+
     Args:
         client: Slack AsyncWebClient for API calls
         user_id: Slack user ID to fetch information for
@@ -223,6 +233,47 @@ async def fetch_user_info(client: AsyncWebClient, user_id: str) -> UserInfo | No
     Returns:
         UserInfo object with complete user data, or None if fetch failed
     """
+    cached = _user_info_cache.get(user_id)
+    if cached is not None and time.monotonic() - cached[0] < USER_INFO_TTL_SECONDS:
+        return cached[1]
+
+    lock = _user_info_locks.setdefault(user_id, asyncio.Lock())
+    try:
+        async with lock:
+            # another caller may have populated the cache while we waited on the lock
+            cached = _user_info_cache.get(user_id)
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < USER_INFO_TTL_SECONDS
+            ):
+                return cached[1]
+
+            user_info = await _fetch_user_info(client=client, user_id=user_id)
+            if user_info is not None:
+                _cache_user_info(user_id, user_info)
+            return user_info
+    finally:
+        # waiters keep their own reference, so the lock only needs to stay
+        # registered while it is held
+        if not lock.locked() and _user_info_locks.get(user_id) is lock:
+            del _user_info_locks[user_id]
+
+
+def _cache_user_info(user_id: str, user_info: UserInfo) -> None:
+    now = time.monotonic()
+    # entries are kept in fetch order, so the expired ones are at the front
+    while _user_info_cache:
+        oldest_id = next(iter(_user_info_cache))
+        if now - _user_info_cache[oldest_id][0] < USER_INFO_TTL_SECONDS:
+            break
+        del _user_info_cache[oldest_id]
+    # re-insert rather than overwrite so the entry moves to the back
+    _user_info_cache.pop(user_id, None)
+    _user_info_cache[user_id] = (now, user_info)
+
+
+@logfire.instrument("fetch_user_info", extract_args=["user_id"])
+async def _fetch_user_info(client: AsyncWebClient, user_id: str) -> UserInfo | None:
     try:
         resp = await client.users_info(user=user_id, include_locale=True)
 
@@ -562,6 +613,12 @@ async def set_status(
         logfire.exception("Failed to set status of assistant", message=message)
 
 
+# chat streams hold text back until this many characters are buffered; the
+# SDK default of 256 delays the start of a reply, while flushing every delta
+# would quickly hit Slack's rate limits on chat.appendStream
+STREAM_BUFFER_SIZE = 128
+
+
 async def append_message_to_stream(
     client: AsyncWebClient,
     channel_id: str,
@@ -601,6 +658,7 @@ async def append_message_to_stream(
             recipient_user_id=recipient_user_id,
             recipient_team_id=recipient_team_id,
             thread_ts=thread_ts,
+            buffer_size=STREAM_BUFFER_SIZE,
         )
     )
 
@@ -697,14 +755,19 @@ async def stream_response_to_mention(
                 stream=slack_stream,
             )
 
-    # at the end of text part, add some new lines
+    # at the end of text part, finish its message
     # at the end of a tool call part, let's show the arguments in a codeblock
     elif isinstance(stream_event, PartEndEvent):
-        if isinstance(stream_event.part, TextPart):
-            slack_stream = await append(
-                markdown_text="\n\n",
-                stream=slack_stream,
-            )
+        # the stream only sends text once its buffer fills, and stopping it is
+        # the public way to send the rest, so text written before a tool call
+        # is not held back until the tool returns; the next text part starts
+        # a new message
+        if isinstance(stream_event.part, TextPart) and slack_stream is not None:
+            try:
+                await slack_stream.stop()
+            except (SlackRequestError, SlackApiError) as e:
+                logfire.exception("Failed to stop stream at end of part", error=str(e))
+            slack_stream = None
         if isinstance(stream_event.part, BaseToolCallPart):
             await set_status(
                 client=client,
@@ -713,38 +776,26 @@ async def stream_response_to_mention(
                 is_busy=True,
             )
 
-        # let's flush the buffer at the end of a part so that conversation is a flowin'
-        if slack_stream is not None and slack_stream._buffer:
-            try:
-                await slack_stream._flush_buffer()
-            except (SlackRequestError, SlackApiError) as e:
-                # Stream might already be stopped (e.g., from early stop() call), log but continue
-                logfire.exception("Failed to flush stream buffer", error=str(e))
+    return slack_stream
 
-                # if there is more in the buffer, let's create a new
-                # stream and send what is in the buffer
-                if slack_stream._buffer:
-                    logfire.info("Could not flush buffer, appending to a new stream")
-                    await append(markdown_text=slack_stream._buffer)
 
-    return slack_stream
+# the parts of the proactive prompt that never change; slack_sdk only
+# serializes blocks, so they can be shared between messages
+_PROACTIVE_PROMPT_YES = {"type": "plain_text", "text": "Yes"}
+_PROACTIVE_PROMPT_NO = {"type": "plain_text", "text": "No"}
 
 
 async def send_proactive_prompt(
     client: AsyncWebClient, channel: str, user: str, event_hist_id: int
 ):
+    text = f"Hey {get_handle_link(user)}, would you like me to assist you?"
+    value = str(event_hist_id)
     await client.chat_postEphemeral(
         channel=channel,
         user=user,
-        text=f"Hey {get_handle_link(user)}, would you like me to assist you?",
+        text=text,
         blocks=[
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"Hey {get_handle_link(user)}, would you like me to assist you?",
-                },
-            },
+            {"type": "section", "text": {"type": "mrkdwn", "text": text}},
             {
                 "type": "actions",
                 "elements": [
@@ -752,14 +803,14 @@ async def send_proactive_prompt(
                         "type": "button",
                         "action_id": CONFIRM_PROACTIVE_PROMPT,
                         "style": "primary",
-                        "text": {"type": "plain_text", "text": "Yes"},
-                        "value": f"{event_hist_id}",
+                        "text": _PROACTIVE_PROMPT_YES,
+                        "value": value,
                     },
                     {
                         "type": "button",
                         "action_id": REJECT_PROACTIVE_PROMPT,
-                        "text": {"type": "plain_text", "text": "No"},
-                        "value": f"{event_hist_id}",
+                        "text": _PROACTIVE_PROMPT_NO,
+                        "value": value,
                     },
                 ],
             },
@@ -1212,10 +1263,14 @@ def request_feedback(client: AsyncWebClient, channel: str, thread_ts: str) -> No
         await asyncio.sleep(10)
         await send_feedback_button(client=client, channel=channel, thread_ts=message_ts)
 
-    asyncio.create_task(
+    # the event loop only keeps a weak reference to tasks, so hold on to it
+    # until it is done or it may be garbage collected before it runs
+    task = asyncio.create_task(
         _delayed_feedback(
             client,
             channel=channel,
             message_ts=thread_ts,
         )
     )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
@@ -9,6 +9,7 @@ import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable
 
 import logfire
 from htmlslacker import HTMLSlacker
@@ -87,6 +88,18 @@ logger = logging.getLogger(__name__)
 AGENT_USAGE_LIMITS = UsageLimits(output_tokens_limit=40_000, request_limit=150)
 
 
+async def _send_slack_feedback(*calls: Awaitable[object]) -> None:
+    """Run independent Slack feedback calls concurrently.
+
+    A failed call is logged rather than raised, so it neither hides the error
+    the caller is handling nor fails a task whose reply was already sent.
+    """
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("slack feedback call failed", exc_info=result)
+
+
 class TaskHandler(ABC):
     """Abstract base class for event handlers registered with TaskProcessor."""
 
@@ -126,6 +139,10 @@ class TaskProcessor:
                 event_type=type(event).__name__,
             )
             return
+        # Salesforce and rule match events have no Slack message to reply to
+        reply_in_slack = not isinstance(
+            event, (SalesforceBaseEvent, UserDefinedRuleMatch)
+        )
         try:
             await handler.handle(task)
         except UsageLimitExceeded as e:
@@ -134,26 +151,30 @@ class TaskProcessor:
             # task would just hit the limit again, so ack it and tell the user
             # to split the request instead of requeueing.
             logger.warning("handler hit usage limit", exc_info=e)
-            if not isinstance(event, (SalesforceBaseEvent, UserDefinedRuleMatch)):
-                await add_reaction(hctx.app.client, event.channel, event.ts, "x")
-                await post_response(
-                    client=hctx.app.client,
-                    channel=event.channel,
-                    thread_ts=event.thread_ts if event.thread_ts else event.ts,
-                    text="That request is too large for me to handle in one go. Please split it into smaller batches (for example, fewer items per message) and try again.",
+            if reply_in_slack:
+                await _send_slack_feedback(
+                    add_reaction(hctx.app.client, event.channel, event.ts, "x"),
+                    post_response(
+                        client=hctx.app.client,
+                        channel=event.channel,
+                        thread_ts=event.thread_ts or event.ts,
+                        text="That request is too large for me to handle in one go. Please split it into smaller batches (for example, fewer items per message) and try again.",
+                    ),
                 )
             return
         except Exception as e:
             logger.exception("handler failed", exc_info=e)
-            if not isinstance(event, (SalesforceBaseEvent, UserDefinedRuleMatch)):
-                await add_reaction(hctx.app.client, event.channel, event.ts, "x")
-                await post_response(
-                    client=hctx.app.client,
-                    channel=event.channel,
-                    thread_ts=event.thread_ts if event.thread_ts else event.ts,
-                    text="I experienced an issue trying to respond. I will try again."
-                    if task.attempts < self._agent.max_attempts
-                    else "I give up. Sorry.",
+            if reply_in_slack:
+                await _send_slack_feedback(
+                    add_reaction(hctx.app.client, event.channel, event.ts, "x"),
+                    post_response(
+                        client=hctx.app.client,
+                        channel=event.channel,
+                        thread_ts=event.thread_ts or event.ts,
+                        text="I experienced an issue trying to respond. I will try again."
+                        if task.attempts < self._agent.max_attempts
+                        else "I give up. Sorry.",
+                    ),
                 )
             raise
 
@@ -175,6 +196,7 @@ class SlackTaskHandler(TaskHandler):
     async def handle(self, task: Task) -> None:
         hctx = self._hctx
         event: SlackAppMentionEvent | SlackMessageEvent = task.event
+        reply_ts = event.thread_ts or event.ts
 
         if await user_ignored(pool=hctx.pool, user_id=event.user):
             logfire.info("Ignore user", user_id=event.user)
@@ -195,7 +217,7 @@ class SlackTaskHandler(TaskHandler):
             await post_response(
                 client=hctx.app.client,
                 channel=event.channel,
-                thread_ts=event.thread_ts or event.ts,
+                thread_ts=reply_ts,
                 text="I cannot process your request at this time due to usage limits. Please ask me again later.",
             )
             return
@@ -210,7 +232,7 @@ class SlackTaskHandler(TaskHandler):
         await set_status(
             client=hctx.app.client,
             channel_id=event.channel,
-            thread_ts=event.thread_ts or event.ts,
+            thread_ts=reply_ts,
             is_busy=True,
         )
         slack_stream = None
@@ -232,17 +254,21 @@ class SlackTaskHandler(TaskHandler):
                     thread_ts=event.thread_ts,
                 )
 
-        if slack_stream is not None and slack_stream._state != "completed":
+        if slack_stream is not None:
             rest = await slack_stream.stop()
             logfire.info("ended", extra={"res": rest})
 
-        await set_status(
-            client=hctx.app.client,
-            channel_id=event.channel,
-            thread_ts=event.thread_ts or event.ts,
-            is_busy=False,
+        # the status and reaction are independent, so clear the one and add the
+        # other concurrently instead of waiting on two Slack round trips
+        await _send_slack_feedback(
+            set_status(
+                client=hctx.app.client,
+                channel_id=event.channel,
+                thread_ts=reply_ts,
+                is_busy=False,
+            ),
+            add_reaction(hctx.app.client, event.channel, event.ts, "white_check_mark"),
         )
-        await add_reaction(hctx.app.client, event.channel, event.ts, "white_check_mark")
 
 
 class SalesforceAssignmentChangedHandler(TaskHandler):
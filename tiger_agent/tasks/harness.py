@@ -8,24 +8,40 @@ with atomic task claiming, retry logic, and automatic cleanup.
 
 Key Components:
 - TaskHarness: Main orchestrator for task processing
-- HarnessContext: Shared resources (Slack app, database pool, trigger) for listeners and processors
+- HarnessContext: Shared resources (Slack app, database pool) for listeners and processors
 - Task: Data model for work queue items
 - Database integration with agent.event table as work queue
 """
 
 import asyncio
+import contextlib
 import logging
 import random
-from asyncio import QueueShutDown, TaskGroup
+import time
+from asyncio import TaskGroup
 
+from psycopg import AsyncConnection, sql
+
+from tiger_agent.db.constants import EVENT_NOTIFY_CHANNEL
 from tiger_agent.db.utils import delete_expired_events
 from tiger_agent.migrations import runner
 from tiger_agent.tasks.handlers import TaskProcessor
 from tiger_agent.tasks.utils import process_tasks
 from tiger_agent.types import HarnessContext
+from tiger_agent.utils import backoff_sleep
 
 logger = logging.getLogger(__name__)
 
+# while the listener is connected new events wake workers directly, so polling
+# only has to pick up retries, delayed events and expired events
+LISTENING_WORKER_SLEEP_SECONDS = 300
+
+# a failed worker is restarted within 1s, the window doubling up to this cap while it keeps failing
+WORKER_RESTART_MAX_BACKOFF_SECONDS = 60
+
+# a lost event listener reconnects within 1s, the window doubling up to this cap while it keeps failing
+LISTEN_RECONNECT_MAX_BACKOFF_SECONDS = 60
+
 
 class TaskHarness:
     """
@@ -41,11 +57,13 @@ class TaskHarness:
     **Bounded Concurrency**: Fixed number of worker tasks (num_workers) ensures predictable
     resource usage and prevents overwhelming downstream systems.
 
-    **Immediate Task Handling**: When tasks arrive, exactly one worker is immediately "poked" via an
-    asyncio.Queue trigger on the HarnessContext, ensuring tasks are processed without delay rather than
-    waiting for the next polling cycle.
+    **Immediate Task Handling**: agent.insert_event() issues a NOTIFY on the agent_event channel.
+    The harness LISTENs on a dedicated connection and "pokes" one worker per notification by
+    setting that worker's asyncio.Event, ensuring tasks are processed without delay rather than
+    waiting for the next polling cycle, even when they were inserted by another process. Setting
+    an event is idempotent, so a burst of notifications collapses into one wakeup per worker.
 
-    **Atomic Task Claiming**: Multiple workers compete for tasks using agent.claim_event(),
+    **Atomic Task Claiming**: Multiple workers compete for tasks using agent.claim_events(),
     which atomically assigns tasks to exactly one worker, preventing duplicate processing.
 
     **Resilient Retry Logic**: Failed/missed tasks are automatically retried through:
@@ -55,7 +73,7 @@ class TaskHarness:
 
     Args:
         task_processor: Callback function that processes claimed tasks
-        ctx: Shared context providing app, pool, trigger, and optional salesforce client
+        ctx: Shared context providing app, pool, and optional salesforce client
         worker_sleep_seconds: Base sleep time between worker runs
         worker_min_jitter_seconds: Minimum random jitter for worker sleep
         worker_max_jitter_seconds: Maximum random jitter for worker sleep
@@ -63,6 +81,7 @@ class TaskHarness:
         max_age_minutes: Maximum age before tasks are expired
         invisibility_minutes: How long claimed tasks remain invisible
         num_workers: Number of concurrent worker tasks (bounded concurrency)
+        max_concurrent_tasks: Maximum tasks claimed or processed at once across all workers
     """
 
     def __init__(
@@ -72,23 +91,42 @@ class TaskHarness:
     ):
         self._task_processor = task_processor
         self._hctx = hctx
+        # workers take free slots before claiming and claim at most that many
+        # events, so this bounds both claimed and in-flight tasks across all
+        # workers and a claimed task never waits for a slot
+        self._task_slots = asyncio.Semaphore(
+            hctx.max_concurrent_tasks or hctx.num_workers * 2
+        )
+        # one wakeup per worker; the listener sets them round-robin
+        self._wakeups = [asyncio.Event() for _ in range(hctx.num_workers)]
+        self._next_wakeup = 0
+        self._listening = False
+        # a harness-owned generator, so jitter can be seeded deterministically
+        self._rng = random.Random()
         assert hctx.worker_sleep_seconds > 0
+        assert hctx.max_concurrent_tasks is None or hctx.max_concurrent_tasks > 0
         assert hctx.worker_sleep_seconds - hctx.worker_min_jitter_seconds > 0
         assert hctx.worker_max_jitter_seconds > hctx.worker_min_jitter_seconds
 
-    def _calc_worker_sleep(self) -> int:
+    def _calc_worker_sleep(self) -> float:
         """Calculate sleep duration for worker with random jitter.
 
         Adds random jitter to the base sleep time to prevent workers
-        from synchronizing and creating thundering herd effects.
+        from synchronizing and creating thundering herd effects. While the
+        listener is connected, the base sleep time is raised to at least
+        LISTENING_WORKER_SLEEP_SECONDS.
 
         Returns:
-            int: Sleep duration in seconds with jitter applied
+            float: Sleep duration in seconds with jitter applied
         """
-        jitter = random.randint(
-            self._hctx.worker_min_jitter_seconds, self._hctx.worker_max_jitter_seconds
-        )
-        return self._hctx.worker_sleep_seconds + jitter
+        min_jitter = self._hctx.worker_min_jitter_seconds
+        jitter_range = self._hctx.worker_max_jitter_seconds - min_jitter
+        # spread over the whole range, not just whole seconds
+        jitter = min_jitter + jitter_range * self._rng.random()
+        sleep_seconds = self._hctx.worker_sleep_seconds
+        if self._listening:
+            sleep_seconds = max(sleep_seconds, LISTENING_WORKER_SLEEP_SECONDS)
+        return sleep_seconds + jitter
 
     async def _worker(self, worker_id: int, initial_sleep_seconds: int):
         """Main worker loop for processing tasks.
@@ -102,17 +140,13 @@ class TaskHarness:
             initial_sleep_seconds: Initial delay before starting work
         """
 
-        async def worker_run():
-            await process_tasks(
+        async def worker_run() -> bool:
+            return await process_tasks(
                 self._task_processor,
                 self._hctx,
                 self._hctx.max_attempts,
                 self._hctx.invisibility_minutes,
-            )
-            await delete_expired_events(
-                pool=self._hctx.pool,
-                max_attempts=self._hctx.max_attempts,
-                max_age_minutes=self._hctx.max_age_minutes,
+                self._task_slots,
             )
 
         if initial_sleep_seconds > 0:
@@ -126,22 +160,146 @@ class TaskHarness:
             await asyncio.sleep(initial_sleep_seconds)
 
         logger.info("starting worker", extra={"worker_id": worker_id})
+        wakeup = self._wakeups[worker_id]
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), timeout=self._calc_worker_sleep())
+            # clear before working so events inserted meanwhile wake us again
+            wakeup.clear()
+            if await worker_run():
+                # stopped at the task cap with a backlog left; go again
+                # instead of leaving it until the next poll
+                wakeup.set()
+
+    async def _janitor(self):
+        """Sweep expired events and verify idle pool connections.
+
+        Runs once per polling interval in its own task, so workers never wait
+        on housekeeping and it happens once per harness no matter how many
+        workers there are or how often they wake. A failed sweep is logged
+        and retried next interval.
+        """
         while True:
+            await asyncio.sleep(self._hctx.worker_sleep_seconds)
             try:
-                await asyncio.wait_for(
-                    self._hctx.trigger.get(), timeout=self._calc_worker_sleep()
+                await delete_expired_events(
+                    pool=self._hctx.pool,
+                    max_attempts=self._hctx.max_attempts,
+                    max_age_minutes=self._hctx.max_age_minutes,
                 )
-                await worker_run()
-            except TimeoutError:
-                await worker_run()
-            except QueueShutDown:
+                # connections are not checked on every checkout; replace any
+                # idle ones the server dropped before a worker or listener
+                # picks them up
+                await self._hctx.pool.check()
+            except Exception as e:
+                logger.exception("periodic cleanup failed", exc_info=e)
+
+    async def _backoff_sleep(self, backoff_seconds: float):
+        """Sleep a random duration of up to backoff_seconds ("full jitter").
+
+        After a database outage every worker of every replica fails at about
+        the same moment; spreading their retries over the whole backoff
+        window keeps them from hitting the recovering server in lockstep.
+        """
+        await backoff_sleep(backoff_seconds, self._rng)
+
+    async def _supervised_worker(self, worker_id: int, initial_sleep_seconds: int):
+        """Run a worker, restarting it with exponential backoff when it fails.
+
+        A worker only fails when the database does (e.g. claiming while the
+        server restarts); task failures are retried through the queue. Without
+        supervision the failure would tear down the whole TaskGroup, listeners
+        included.
+        """
+        backoff_seconds = 1
+        while True:
+            started = time.monotonic()
+            try:
+                await self._worker(worker_id, initial_sleep_seconds)
                 return
+            except Exception as e:
+                # a worker that ran fine for a while starts over with a short backoff
+                if time.monotonic() - started > WORKER_RESTART_MAX_BACKOFF_SECONDS:
+                    backoff_seconds = 1
+                logger.exception(
+                    "worker failed, restarting",
+                    extra={"worker_id": worker_id, "backoff_seconds": backoff_seconds},
+                    exc_info=e,
+                )
+            await self._backoff_sleep(backoff_seconds)
+            backoff_seconds = min(
+                backoff_seconds * 2, WORKER_RESTART_MAX_BACKOFF_SECONDS
+            )
+            initial_sleep_seconds = 0
+
+    def _wake_worker(self):
+        """Wake the next worker in round-robin order."""
+        self._wakeups[self._next_wakeup].set()
+        self._next_wakeup = (self._next_wakeup + 1) % len(self._wakeups)
+
+    async def _listen_once(self):
+        """Poke a worker for every event inserted anywhere.
+
+        Holds a dedicated connection outside the pool, since a LISTENing
+        connection must stay open for as long as the harness runs. While it
+        is connected workers poll less often; if the connection is lost, all
+        workers are woken so they fall back to polling at the configured rate.
+        """
+        pool = self._hctx.pool
+        try:
+            async with await AsyncConnection.connect(
+                pool.conninfo, **{**(pool.kwargs or {}), "autocommit": True}
+            ) as con:
+                await con.execute(
+                    sql.SQL("listen {}").format(sql.Identifier(EVENT_NOTIFY_CHANNEL))
+                )
+                logger.info(
+                    "listening for events", extra={"channel": EVENT_NOTIFY_CHANNEL}
+                )
+                self._listening = True
+                async for _ in con.notifies():
+                    self._wake_worker()
+        finally:
+            if self._listening:
+                self._listening = False
+                for wakeup in self._wakeups:
+                    wakeup.set()
+
+    async def _listen(self):
+        """Keep the event listener connected, reconnecting with exponential backoff.
+
+        Workers poll at the configured rate while the listener is down, so
+        events are still picked up, just later. Without reconnecting, one
+        dropped connection (e.g. a server restart) would leave every replica
+        polling for the rest of its life.
+        """
+        backoff_seconds = 1
+        while True:
+            started = time.monotonic()
+            try:
+                await self._listen_once()
+            except Exception as e:
+                logger.exception(
+                    "event listener failed, falling back to polling", exc_info=e
+                )
+            # a listener that stayed connected for a while starts over with a short backoff
+            if time.monotonic() - started > LISTEN_RECONNECT_MAX_BACKOFF_SECONDS:
+                backoff_seconds = 1
+            logger.info(
+                "reconnecting event listener",
+                extra={"backoff_seconds": backoff_seconds},
+            )
+            await self._backoff_sleep(backoff_seconds)
+            backoff_seconds = min(
+                backoff_seconds * 2, LISTEN_RECONNECT_MAX_BACKOFF_SECONDS
+            )
 
     def _worker_args(self, num_workers: int) -> list[tuple[int, int]]:
         """Generate worker arguments with staggered start times.
 
         Creates a list of (worker_id, initial_sleep) tuples where the first
-        worker starts immediately and subsequent workers are randomly staggered.
+        worker starts immediately and subsequent workers are spread evenly
+        across one sleep period, so their polls never bunch up.
 
         Args:
             num_workers: Number of workers to create
@@ -149,21 +307,19 @@ class TaskHarness:
         Returns:
             list[tuple[int, int]]: List of (worker_id, initial_sleep_seconds) pairs
         """
-        initial_sleeps: list[int] = [0]  # first worker starts immediately
-        initial_sleeps.extend(
-            random.sample(range(1, self._hctx.worker_sleep_seconds), num_workers - 1)
-        )
+        sleep_seconds = self._hctx.worker_sleep_seconds
         return [
-            (worker_id, initial_sleep)
-            for worker_id, initial_sleep in enumerate(initial_sleeps)
+            (worker_id, worker_id * sleep_seconds // num_workers)
+            for worker_id in range(num_workers)
         ]
 
     async def run(self, tasks: TaskGroup):
         """Run the harness workers within an existing TaskGroup.
 
-        Runs database migrations then starts all workers. Designed to be called
-        alongside listener start() calls within the same TaskGroup so that
-        listeners and workers run concurrently.
+        Runs database migrations then starts the event listener and all
+        workers. Designed to be called alongside listener start() calls
+        within the same TaskGroup so that listeners and workers run
+        concurrently.
 
         Args:
             tasks: The asyncio TaskGroup to create worker tasks in
@@ -171,7 +327,10 @@ class TaskHarness:
         async with self._hctx.pool.connection() as con:
             await runner.migrate_db(con)
 
+        tasks.create_task(self._listen())
+        tasks.create_task(self._janitor())
+
         logger.info(f"creating {self._hctx.num_workers} workers")
         for worker_id, initial_sleep in self._worker_args(self._hctx.num_workers):
             logger.info("creating worker", extra={"worker_id": worker_id})
-            tasks.create_task(self._worker(worker_id, initial_sleep))
+            tasks.create_task(self._supervised_worker(worker_id, initial_sleep))
@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Annotated, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Discriminator, Tag
 
 from tiger_agent.salesforce.types import (
     SalesforceAssignmentChangedEvent,
@@ -11,6 +12,7 @@ from tiger_agent.salesforce.types import (
     UserDefinedRuleMatch,
 )
 from tiger_agent.slack.types import (
+    AGENT_FEEDBACK_REQUEST_REMINDER,
     AgentFeedbackRatingEvent,
     AgentFeedbackRequestReminderEvent,
     SlackAppMentionEvent,
@@ -19,6 +21,23 @@ from tiger_agent.slack.types import (
 )
 
 
+def _event_tag(value: Any) -> str | None:
+    """Pick the event model for a payload from its type (and Salesforce subtype).
+
+    Lets pydantic validate each claimed payload against exactly one model
+    instead of trying every member of the union in turn.
+    """
+    if isinstance(value, dict):
+        event_type = value.get("type")
+        subtype = value.get("subtype")
+    else:
+        event_type = getattr(value, "type", None)
+        subtype = getattr(value, "subtype", None)
+    if event_type == "salesforce_event":
+        return subtype
+    return event_type
+
+
 class Task(BaseModel):
     """Database representation of a task from the agent.event table.
 
@@ -30,7 +49,8 @@ class Task(BaseModel):
         event_ts: Timestamp when the task was created
         attempts: Number of processing attempts made
         vt: Visibility timeout - when task becomes available for processing
-        claimed: Array of timestamps when task was claimed by workers
+        last_claimed: When the task was most recently claimed by a worker, if ever.
+            The full claim history stays in the database.
         event: The original event payload
     """
 
@@ -38,17 +58,23 @@ class Task(BaseModel):
     event_ts: datetime
     attempts: int
     vt: datetime
-    claimed: list[datetime]
-    event: (
-        SlackAppMentionEvent
-        | SlackSalesforceCaseThreadMessageEvent
-        | SlackMessageEvent
-        | SalesforceCreateNewCaseEvent
-        | SalesforceAssignmentChangedEvent
-        | SalesforceCaseCreatedEvent
-        | SalesforceFeedItemEvent
-        | SalesforceCaseStatusChangedEvent
-        | AgentFeedbackRatingEvent
-        | AgentFeedbackRequestReminderEvent
-        | UserDefinedRuleMatch
-    )
+    last_claimed: datetime | None = None
+    event: Annotated[
+        Annotated[SlackAppMentionEvent, Tag("app_mention")]
+        | Annotated[
+            SlackSalesforceCaseThreadMessageEvent,
+            Tag("slack_salesforce_case_thread_message"),
+        ]
+        | Annotated[SlackMessageEvent, Tag("message")]
+        | Annotated[SalesforceCreateNewCaseEvent, Tag("create_new_case")]
+        | Annotated[SalesforceAssignmentChangedEvent, Tag("new_assignee")]
+        | Annotated[SalesforceCaseCreatedEvent, Tag("case_created")]
+        | Annotated[SalesforceFeedItemEvent, Tag("new_feed_item")]
+        | Annotated[SalesforceCaseStatusChangedEvent, Tag("case_status_changed")]
+        | Annotated[AgentFeedbackRatingEvent, Tag("agent_feedback_rating")]
+        | Annotated[
+            AgentFeedbackRequestReminderEvent, Tag(AGENT_FEEDBACK_REQUEST_REMINDER)
+        ]
+        | Annotated[UserDefinedRuleMatch, Tag("custom_rule_match")],
+        Discriminator(_event_tag),
+    ]
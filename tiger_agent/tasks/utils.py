@@ -1,26 +1,33 @@
+import asyncio
 import logging
 
 import logfire
 
-from tiger_agent.db.utils import claim_event, delete_event
+from tiger_agent.db.utils import (
+    claim_events,
+    complete_and_claim_events,
+    delete_event,
+)
 from tiger_agent.tasks.handlers import TaskProcessor
 from tiger_agent.tasks.types import Task
 from tiger_agent.types import HarnessContext
 
 logger = logging.getLogger(__name__)
 
+# a worker claims at most this many events per database round-trip
+CLAIM_BATCH_SIZE = 20
 
-async def process_task(
-    task_processor: TaskProcessor, hctx: HarnessContext, task: Task
-) -> bool:
-    """Process a single claimed task.
+# while claims keep coming back full, a worker works through at most this
+# many tasks per trigger before going back to sleep
+MAX_TASKS_PER_RUN = 3 * CLAIM_BATCH_SIZE
 
-    Calls the registered task processor with the task and context.
-    On success, marks the task as completed. On failure, leaves the task
-    in the queue for retry by other workers.
 
-    Args:
-        task: The claimed task to process
+async def _run_task(
+    task_processor: TaskProcessor,
+    hctx: HarnessContext,
+    task: Task,
+) -> bool:
+    """Call the registered task processor with the task and context.
 
     Returns:
         bool: True if processing succeeded, False if it failed
@@ -28,7 +35,6 @@ async def process_task(
     with logfire.span("process_task", task=task) as _:
         try:
             await task_processor(hctx, task)
-            await delete_event(pool=hctx.pool, event=task)
             return True
         except Exception as e:
             logger.exception(
@@ -38,27 +44,129 @@ async def process_task(
         return False
 
 
+async def process_task(
+    task_processor: TaskProcessor,
+    hctx: HarnessContext,
+    task: Task,
+) -> bool:
+    """Process a single claimed task.
+
+    Calls the registered task processor with the task and context.
+    On success, marks the task as completed. On failure, leaves the task
+    in the queue for retry by other workers.
+
+    Args:
+        task: The claimed task to process
+
+    Returns:
+        bool: True if processing succeeded, False if it failed
+    """
+    if not await _run_task(task_processor, hctx, task):
+        return False
+    try:
+        await delete_event(pool=hctx.pool, event=task)
+        return True
+    except Exception as e:
+        logger.exception(
+            "task completion failed", extra={"task_id": task.id}, exc_info=e
+        )
+    return False
+
+
+async def _acquire_slots(task_slots: asyncio.Semaphore, limit: int) -> int:
+    """Take between one and `limit` task slots, waiting only for the first.
+
+    Returns:
+        int: The number of slots taken; the caller must release each of them
+    """
+    await task_slots.acquire()
+    acquired = 1
+    # acquiring an unlocked semaphore returns without waiting
+    while acquired < limit and not task_slots.locked():
+        await task_slots.acquire()
+        acquired += 1
+    return acquired
+
+
 async def process_tasks(
     task_processor: TaskProcessor,
     hctx: HarnessContext,
     max_attempts: int,
     invisibility_minutes: int,
-):
-    """Process available tasks in a batch.
+    task_slots: asyncio.Semaphore,
+) -> bool:
+    """Claim available tasks and work through them concurrently.
+
+    task_slots is shared by all workers and bounds how many tasks are
+    processed at once across the harness. Slots are taken before claiming
+    and a worker claims no more tasks than it holds slots for (at most
+    CLAIM_BATCH_SIZE, in a single database round-trip), so a claimed task
+    starts right away instead of queuing for a slot while its invisibility
+    window runs out.
+
+    Each task is marked completed as soon as it succeeds, not when the
+    tasks claimed with it are done: agent turns take minutes, and a finished
+    task left claimed behind a slow one could outlive its invisibility window
+    and be processed (and answered) a second time. While claims come back
+    full, completing a task also claims the next one for its slot in the same
+    pipelined round-trip, up to MAX_TASKS_PER_RUN tasks. A failed task or an
+    empty claim stops the draining; failed tasks stay in the queue and become
+    visible again once their invisibility window expires.
 
-    Attempts to claim and process up to 20 tasks in sequence.
-    Stops early if no tasks are available or if processing fails,
-    allowing the worker to sleep and try again later.
+    Returns:
+        bool: True if the run stopped at MAX_TASKS_PER_RUN while claims were
+            still coming back full, i.e. there is likely more work
     """
-    # while we are finding tasks to claim, keep working for a bit but not forever
-    for _ in range(20):
-        task = await claim_event(
+    slots = await _acquire_slots(task_slots, CLAIM_BATCH_SIZE)
+    tasks: list[Task] = []
+    try:
+        tasks = await claim_events(
             pool=hctx.pool,
             max_attempts=max_attempts,
             invisibility_minutes=invisibility_minutes,
+            limit=slots,
         )
-        if not task:
-            return
-        if not await process_task(task_processor, hctx, task):
-            # if we failed to process the task, stop working for now
-            return
+    finally:
+        # hand back the slots no claimed task will use (all of them if the
+        # claim failed)
+        for _ in range(slots - len(tasks)):
+            task_slots.release()
+
+    # a full claim suggests a backlog; keep working for a bit but not forever
+    backlog = len(tasks) == slots
+    claimed = len(tasks)
+
+    async def work_slot(task: Task) -> None:
+        nonlocal backlog, claimed
+        try:
+            while await _run_task(task_processor, hctx, task):
+                refill = backlog and claimed < MAX_TASKS_PER_RUN
+                if not refill:
+                    await delete_event(pool=hctx.pool, event=task)
+                    return
+                # count the claim before awaiting it so that slots refilling
+                # concurrently do not overshoot MAX_TASKS_PER_RUN
+                claimed += 1
+                next_tasks = await complete_and_claim_events(
+                    pool=hctx.pool,
+                    event=task,
+                    max_attempts=max_attempts,
+                    invisibility_minutes=invisibility_minutes,
+                )
+                if not next_tasks:
+                    claimed -= 1
+                    backlog = False
+                    return
+                task = next_tasks[0]
+            # if we failed to process the task, stop draining for now
+            backlog = False
+        except Exception as e:
+            logger.exception(
+                "task completion failed", extra={"task_id": task.id}, exc_info=e
+            )
+            backlog = False
+        finally:
+            task_slots.release()
+
+    await asyncio.gather(*(work_slot(task) for task in tasks))
+    return backlog and claimed >= MAX_TASKS_PER_RUN
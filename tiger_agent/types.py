@@ -1,4 +1,3 @@
-from asyncio import Queue
 from dataclasses import dataclass
 
 from psycopg_pool import AsyncConnectionPool
@@ -8,18 +7,19 @@ from slack_bolt.app.async_app import AsyncApp
 from tiger_agent.slack.types import BotInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class HarnessContext:
     """Shared context provided to listeners and task processors.
 
     Attributes:
         app: Slack Bolt AsyncApp for making Slack API calls
         pool: Database connection pool for PostgreSQL operations
-        trigger: Queue used to wake workers when new tasks are enqueued
         salesforce_client: Optional Salesforce API client
-        bot_info: Bot profile information, populated after listener start
+        bot_info: Bot profile information, populated at startup
         proactive_prompt_channels: Channel IDs where proactive prompts are sent without mentions
         num_workers: Number of concurrent worker tasks
+        max_concurrent_tasks: Maximum tasks claimed or processed at once across all workers,
+            defaults to twice num_workers
         worker_sleep_seconds: Base sleep time between worker polling cycles
         worker_min_jitter_seconds: Minimum random jitter applied to worker sleep
         worker_max_jitter_seconds: Maximum random jitter applied to worker sleep
@@ -30,11 +30,11 @@ class HarnessContext:
 
     app: AsyncApp
     pool: AsyncConnectionPool
-    trigger: Queue
     salesforce_client: Salesforce | None = None
     bot_info: BotInfo | None = None
     proactive_prompt_channels: list[str] | None = None
     num_workers: int = 5
+    max_concurrent_tasks: int | None = None
     worker_sleep_seconds: int = 60
     worker_min_jitter_seconds: int = -15
     worker_max_jitter_seconds: int = 15
@@ -12,9 +12,11 @@ The logging setup is designed to work both in development (without Logfire) and
 production (with full Logfire observability) environments.
 """
 
+import asyncio
 import logging
 import os
-from asyncio import Queue
+import random
+from functools import cache
 from logging.config import dictConfig
 from typing import Any
 
@@ -27,6 +29,8 @@ from pydantic_ai.mcp import (
     ProcessToolCallback,
 )
 from slack_bolt.async_app import AsyncApp
+from slack_bolt.util.async_utils import create_async_web_client
+from slack_sdk.web.async_client import AsyncWebClient
 
 from tiger_agent import __version__
 from tiger_agent.agent.types import AgentResponseContext
@@ -165,14 +169,38 @@ def serialize_to_jsonb(model: BaseModel) -> Jsonb:
     return Jsonb(model.model_dump())
 
 
+async def backoff_sleep(
+    backoff_seconds: float, rng: random.Random | None = None
+) -> None:
+    """Sleep a random duration of up to backoff_seconds ("full jitter").
+
+    After an outage every caller fails at about the same moment; spreading
+    their retries over the whole backoff window keeps them from hitting the
+    recovering service in lockstep.
+    """
+    await asyncio.sleep((rng or random).random() * backoff_seconds)
+
+
 def file_type_supported(mimetype: str) -> bool:
     return mimetype and (
         mimetype == "application/pdf" or mimetype.startswith(("text/", "image/"))
     )
 
 
+@cache
+def _get_slack_client(token: str) -> AsyncWebClient:
+    """One Slack web client per bot token for the whole process.
+
+    Harness contexts in the same process share the client, and with it the
+    HTTP session and its keep-alive connections. Each context still gets its
+    own AsyncApp so listeners are never registered twice on one app.
+    """
+    return create_async_web_client(token=token)
+
+
 def get_harness_ctx(
     num_workers: int = 5,
+    max_concurrent_tasks: int | None = None,
     proactive_prompt_channels: list[str] | None = None,
     worker_sleep_seconds: int = 60,
     worker_min_jitter_seconds: int = -15,
@@ -184,13 +212,14 @@ def get_harness_ctx(
 
     return HarnessContext(
         app=AsyncApp(
-            token=os.environ["SLACK_BOT_TOKEN"], ignoring_self_events_enabled=False
+            client=_get_slack_client(os.environ["SLACK_BOT_TOKEN"]),
+            ignoring_self_events_enabled=False,
         ),
         pool=create_default_pool(num_workers),
-        trigger=Queue(),
         salesforce_client=get_salesforce_api_client(),
         proactive_prompt_channels=proactive_prompt_channels,
         num_workers=num_workers,
+        max_concurrent_tasks=max_concurrent_tasks,
         worker_sleep_seconds=worker_sleep_seconds,
         worker_min_jitter_seconds=worker_min_jitter_seconds,
         worker_max_jitter_seconds=worker_max_jitter_seconds,
@@ -220,7 +249,8 @@ def _to_yaml(value: Any, indent: int = 0) -> str:
 
 
 def pretty_print_models(models: list[BaseModel]) -> str:
-    parts = []
-    for model in models:
-        parts.append(f"---\n{_to_yaml(model.model_dump())}")
-    return "\n\n".join(parts)
+    # let pydantic drop unset fields while dumping instead of building them
+    # into the dict only for _to_yaml to skip them
+    return "\n\n".join(
+        f"---\n{_to_yaml(model.model_dump(exclude_none=True))}" for model in models
+    )